@@ -3,7 +3,7 @@
 
 """The Electricity Trading API client."""
 
-from ._client import Client
+from ._client import CHANNEL_OPTIONS, Client
 from ._types import (
     Currency,
     DeliveryArea,
@@ -32,6 +32,7 @@ from ._types import (
 )
 
 __all__ = [
+    "CHANNEL_OPTIONS",
     "Client",
     "Currency",
     "DeliveryArea",
@@ -0,0 +1,83 @@
+# License: MIT
+# Copyright © 2024 Frequenz Energy-as-a-Service GmbH
+
+"""Module to define a small cache for the results of read-only calls."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+
+class _AsyncTtlCache(Generic[_K, _V]):
+    """A cache for the results of coroutines, that also merges concurrent calls.
+
+    While a result is being fetched, all calls for the same key wait for that single
+    fetch. A successful result is then kept for `ttl` seconds, failures are never
+    kept.
+    """
+
+    __slots__ = ("_ttl", "_entries")
+
+    def __init__(self, ttl: float) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds for which a fetched result is reused. With 0, results are
+                only shared between calls that are made while they are fetched.
+        """
+        self._ttl = ttl
+        self._entries: dict[_K, asyncio.Future[_V]] = {}
+
+    async def get(self, key: _K, fetch: Callable[[], Awaitable[_V]]) -> _V:
+        """Get the result for a key, fetching it if it is not cached.
+
+        Args:
+            key: The key to get the result for.
+            fetch: A function returning an awaitable that fetches the result.
+
+        Returns:
+            The result for the key.
+        """
+        future = self._entries.get(key)
+        if future is None:
+            future = asyncio.ensure_future(fetch())
+            self._entries[key] = future
+            future.add_done_callback(lambda done: self._on_done(key, done))
+        # Shielded, so a cancelled caller doesn't cancel the fetch for the others.
+        return await asyncio.shield(future)
+
+    def _on_done(self, key: _K, future: asyncio.Future[_V]) -> None:
+        """Schedule the removal of a fetched result, or drop it if it failed.
+
+        Args:
+            key: The key the result was fetched for.
+            future: The finished fetch.
+        """
+        if future.cancelled() or future.exception() is not None or self._ttl <= 0:
+            self._discard(key, future)
+        else:
+            asyncio.get_running_loop().call_later(self._ttl, self._discard, key, future)
+
+    def _discard(self, key: _K, future: asyncio.Future[_V]) -> None:
+        """Drop a result, unless it was already replaced by a newer one.
+
+        Args:
+            key: The key of the result.
+            future: The fetch of the result.
+        """
+        if self._entries.get(key) is future:
+            del self._entries[key]
+
+    def invalidate(self, predicate: Callable[[_K], bool]) -> None:
+        """Drop all the results whose key matches a predicate.
+
+        Calls already waiting for a result that is being fetched still get it.
+
+        Args:
+            predicate: A function returning whether the result for a key is dropped.
+        """
+        for key in [key for key in self._entries if predicate(key)]:
+            self._entries.pop(key, None)
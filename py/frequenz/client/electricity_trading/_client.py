@@ -3,8 +3,12 @@
 
 """Module to define the client class."""
 
+import asyncio
+import itertools
+import logging
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Sequence
 from datetime import datetime
-from typing import Awaitable, cast
+from typing import Any, TypeVar
 
 import grpc
 from frequenz.api.electricity_trading.v1 import (
@@ -13,8 +17,10 @@ from frequenz.api.electricity_trading.v1 import (
 )
 from frequenz.channels import Receiver
 from frequenz.client.base.grpc_streaming_helper import GrpcStreamingHelper
-from google.protobuf import field_mask_pb2, struct_pb2
+from google.protobuf import field_mask_pb2
+from google.protobuf.internal import api_implementation
 
+from ._cache import _AsyncTtlCache
 from ._types import (
     DeliveryArea,
     DeliveryPeriod,
@@ -34,8 +40,22 @@ from ._types import (
     Trade,
     TradeState,
     UpdateOrder,
+    _LazyPbSequence,
 )
 
+_logger = logging.getLogger(__name__)
+
+_RequestT = TypeVar("_RequestT")
+_T = TypeVar("_T")
+
+if api_implementation.Type() == "python":
+    _logger.warning(
+        "The pure-Python protobuf implementation is in use, converting messages "
+        "will be considerably slower. Make sure the `upb` backend of `protobuf` "
+        "is installed and `PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION` is not set to "
+        "`python`."
+    )
+
 
 class _Sentinel:
     """A unique object to signify 'no value passed'."""
@@ -44,17 +64,169 @@ class _Sentinel:
 NO_VALUE = _Sentinel()
 
 
-class Client:
+def _as_is(message: Any) -> Any:
+    """Return a protobuf message unchanged, used as converter in raw mode.
+
+    Args:
+        message: The protobuf message.
+
+    Returns:
+        The same message.
+    """
+    return message
+
+
+_UPDATE_ORDER_FIELDS = (
+    "price",
+    "quantity",
+    "stop_price",
+    "peak_price_delta",
+    "display_quantity",
+    "execution_option",
+    "valid_until",
+    "payload",
+    "tag",
+)
+"""Names of the `UpdateOrder` fields, in the order of the `update_gridpool_order` args."""
+
+CHANNEL_OPTIONS: tuple[tuple[str, int], ...] = (
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.http2.initial_window_size", 8 * 1024 * 1024),
+    ("grpc.http2.initial_connection_window_size", 8 * 1024 * 1024),
+    ("grpc.http2.max_frame_size", 16 * 1024 * 1024 - 1),
+    ("grpc.max_receive_message_length", 64 * 1024 * 1024),
+)
+"""Recommended options for the gRPC channels given to the `Client`.
+
+They keep idle connections alive, widen the HTTP/2 flow-control windows and raise
+the maximum message size, so large `list_*` responses and busy streams are not
+stalled waiting for window updates. Pass them as the `options` of
+`grpc.aio.secure_channel()` or `grpc.aio.insecure_channel()`.
+"""
+
+
+async def _iter_pages(
+    fetch_page: Callable[[str | None], Awaitable[tuple[Sequence[_T], str | None]]],
+    prefetch: int,
+) -> AsyncGenerator[_T, None]:
+    """Iterate over the items of all pages, fetching the next pages in the background.
+
+    Args:
+        fetch_page: A function fetching the page for a page token (`None` for the
+            first page), and returning its items and the token of the next page,
+            which is empty or `None` for the last page.
+        prefetch: The number of pages to fetch ahead of the one being iterated.
+
+    Yields:
+        The items of all pages, in order.
+
+    Raises:
+        ValueError: If `prefetch` is smaller than 1.
+    """
+    if prefetch < 1:
+        raise ValueError(f"prefetch must be at least 1, not {prefetch}.")
+
+    pages: asyncio.Queue[Sequence[_T] | Exception | None] = asyncio.Queue(prefetch)
+
+    async def produce() -> None:
+        page_token: str | None = None
+        try:
+            while True:
+                items, page_token = await fetch_page(page_token)
+                await pages.put(items)
+                if not page_token:
+                    break
+        except Exception as exc:  # pylint: disable=broad-except
+            await pages.put(exc)
+            return
+        await pages.put(None)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while (page := await pages.get()) is not None:
+            if isinstance(page, Exception):
+                raise page
+            for item in page:
+                yield item
+    finally:
+        producer.cancel()
+
+
+class Client:  # pylint: disable=too-many-instance-attributes
     """Electricity trading client."""
 
-    def __init__(self, grpc_channel: grpc.aio.Channel) -> None:
+    def __init__(
+        self,
+        grpc_channel: grpc.aio.Channel | Sequence[grpc.aio.Channel],
+        *,
+        build_requests_in_executor: bool = False,
+        orders_cache_ttl: float | None = None,
+        raw: bool = False,
+    ) -> None:
         """Initialize the client.
 
         Args:
-            grpc_channel: gRPC channel to use for communication with the API.
+            grpc_channel: gRPC channel to use for communication with the API. A
+                sequence of channels can be given instead, in which case requests are
+                distributed over them in a round-robin fashion, to avoid contention
+                on a single HTTP/2 connection.
+            build_requests_in_executor: Whether to build the protobuf requests of
+                `create_gridpool_order()` and `update_gridpool_order()` in the event
+                loop's default executor, so other tasks are not blocked while they
+                are built. This adds a thread hand-off to each call, so it is only
+                worth it when building messages is slow, e.g. with the pure-Python
+                protobuf implementation.
+            orders_cache_ttl: Seconds for which the results of
+                `get_gridpool_order()` and `list_gridpool_orders()` are reused for
+                calls with the same arguments. Identical calls made while a result is
+                being fetched then also share it, even with 0. Cached results of a
+                Gridpool are dropped when its orders are created, updated or
+                cancelled through this client. With `None`, the default, every call
+                makes its own request.
+            raw: Whether to return the received protobuf messages as they are,
+                instead of converting them to `OrderDetail`, `Trade` and
+                `PublicTrade` objects. This saves the conversion when only a few
+                fields are needed, but the results then don't match the annotated
+                return types, so it is meant for performance-critical code only.
+
+        Raises:
+            ValueError: If an empty sequence of channels is given.
         """
-        self._stub = electricity_trading_pb2_grpc.ElectricityTradingServiceStub(
-            grpc_channel
+        # Anything that isn't a sequence is taken as a channel, so channel-like
+        # objects (e.g. mocks) keep working.
+        channels = (
+            list(grpc_channel) if isinstance(grpc_channel, Sequence) else [grpc_channel]
+        )
+        if not channels:
+            raise ValueError("At least one gRPC channel must be provided.")
+
+        self._stubs = [
+            electricity_trading_pb2_grpc.ElectricityTradingServiceStub(channel)
+            for channel in channels
+        ]
+        self._stub_indexes = itertools.cycle(range(len(self._stubs)))
+        # Streams are named by sequence number, as formatting their filters is costly
+        self._stream_ids = itertools.count()
+        self._build_requests_in_executor = build_requests_in_executor
+
+        self._order_detail_from_pb: Callable[
+            [electricity_trading_pb2.OrderDetail], OrderDetail
+        ] = (_as_is if raw else OrderDetail.from_pb)
+        self._trade_from_pb: Callable[[electricity_trading_pb2.Trade], Trade] = (
+            _as_is if raw else Trade.from_pb
+        )
+        self._public_trade_from_pb: Callable[
+            [electricity_trading_pb2.PublicTrade], PublicTrade
+        ] = (_as_is if raw else PublicTrade.from_pb)
+
+        self._get_order_cache: _AsyncTtlCache[tuple[int, int], OrderDetail] | None = (
+            None if orders_cache_ttl is None else _AsyncTtlCache(orders_cache_ttl)
+        )
+        self._list_orders_cache: _AsyncTtlCache[
+            tuple[int, GridpoolOrderFilter, PaginationParams], Sequence[OrderDetail]
+        ] | None = (
+            None if orders_cache_ttl is None else _AsyncTtlCache(orders_cache_ttl)
         )
 
         self._gridpool_orders_streams: dict[
@@ -78,7 +250,41 @@ class Client:
             ],
         ] = {}
 
-    async def stream_gridpool_orders(  # pylint: disable=too-many-arguments
+    def _next_stub(
+        self,
+    ) -> electricity_trading_pb2_grpc.ElectricityTradingServiceStub:
+        """Get the stub to use for the next request.
+
+        Returns:
+            The next stub, in round-robin order over the client's channels.
+        """
+        return self._stubs[next(self._stub_indexes)]
+
+    def _invalidate_orders(self, gridpool_id: int) -> None:
+        """Drop the cached orders of a Gridpool.
+
+        Args:
+            gridpool_id: The Gridpool to drop the cached orders for.
+        """
+        if self._get_order_cache is not None:
+            self._get_order_cache.invalidate(lambda key: key[0] == gridpool_id)
+        if self._list_orders_cache is not None:
+            self._list_orders_cache.invalidate(lambda key: key[0] == gridpool_id)
+
+    async def _build_request(self, build: Callable[[], _RequestT]) -> _RequestT:
+        """Build a request, in the default executor if the client is configured so.
+
+        Args:
+            build: Function that builds the request.
+
+        Returns:
+            The built request.
+        """
+        if not self._build_requests_in_executor:
+            return build()
+        return await asyncio.get_running_loop().run_in_executor(None, build)
+
+    def stream_gridpool_orders(  # pylint: disable=too-many-arguments
         self,
         gridpool_id: int,
         order_states: list[OrderState] | None = None,
@@ -99,7 +305,7 @@ class Client:
             tag: Tag to filter for.
 
         Returns:
-            Async generator of orders.
+            Receiver of the gridpool orders.
         """
         gridpool_order_filter = GridpoolOrderFilter(
             order_states=order_states,
@@ -111,20 +317,24 @@ class Client:
 
         stream_key = (gridpool_id, gridpool_order_filter)
 
-        if stream_key not in self._gridpool_orders_streams:
-            self._gridpool_orders_streams[stream_key] = GrpcStreamingHelper(
-                f"electricity-trading-{stream_key}",
-                lambda: self._stub.ReceiveGridpoolOrdersStream(  # type: ignore
-                    electricity_trading_pb2.ReceiveGridpoolOrdersStreamRequest(
-                        gridpool_id=gridpool_id,
-                        filter=gridpool_order_filter.to_pb(),
-                    )
-                ),
-                lambda response: OrderDetail.from_pb(response.order_detail),
+        stream = self._gridpool_orders_streams.get(stream_key)
+        if stream is None:
+            # Pin the stream to one channel, so reconnections don't move it around
+            stub = self._next_stub()
+            # Built once, as the request is sent again on every reconnection
+            request = electricity_trading_pb2.ReceiveGridpoolOrdersStreamRequest(
+                gridpool_id=gridpool_id,
+                filter=gridpool_order_filter.to_pb(),
+            )
+            stream = GrpcStreamingHelper(
+                f"electricity-trading-gridpool-orders-{gridpool_id}-{next(self._stream_ids)}",
+                lambda: stub.ReceiveGridpoolOrdersStream(request),  # type: ignore
+                lambda response: self._order_detail_from_pb(response.order_detail),
             )
-        return self._gridpool_orders_streams[stream_key].new_receiver()
+            self._gridpool_orders_streams[stream_key] = stream
+        return stream.new_receiver()
 
-    async def stream_gridpool_trades(  # pylint: disable=too-many-arguments
+    def stream_gridpool_trades(  # pylint: disable=too-many-arguments
         self,
         gridpool_id: int,
         trade_states: list[TradeState] | None = None,
@@ -157,20 +367,22 @@ class Client:
 
         stream_key = (gridpool_id, gridpool_trade_filter)
 
-        if stream_key not in self._gridpool_trades_streams:
-            self._gridpool_trades_streams[stream_key] = GrpcStreamingHelper(
-                f"electricity-trading-{gridpool_trade_filter}",
-                lambda: self._stub.ReceiveGridpoolTradesStream(  # type: ignore
-                    electricity_trading_pb2.ReceiveGridpoolTradesStreamRequest(
-                        gridpool_id=gridpool_id,
-                        filter=gridpool_trade_filter.to_pb(),
-                    )
-                ),
-                lambda response: Trade.from_pb(response.trade),
+        stream = self._gridpool_trades_streams.get(stream_key)
+        if stream is None:
+            stub = self._next_stub()
+            request = electricity_trading_pb2.ReceiveGridpoolTradesStreamRequest(
+                gridpool_id=gridpool_id,
+                filter=gridpool_trade_filter.to_pb(),
             )
-        return self._gridpool_trades_streams[stream_key].new_receiver()
+            stream = GrpcStreamingHelper(
+                f"electricity-trading-gridpool-trades-{gridpool_id}-{next(self._stream_ids)}",
+                lambda: stub.ReceiveGridpoolTradesStream(request),  # type: ignore
+                lambda response: self._trade_from_pb(response.trade),
+            )
+            self._gridpool_trades_streams[stream_key] = stream
+        return stream.new_receiver()
 
-    async def stream_public_trades(
+    def stream_public_trades(
         self,
         states: list[TradeState] | None = None,
         delivery_period: DeliveryPeriod | None = None,
@@ -187,7 +399,7 @@ class Client:
             sell_delivery_area: Sell delivery area to filter for.
 
         Returns:
-            Async generator of orders.
+            Receiver of the public trades.
         """
         public_trade_filter = PublicTradeFilter(
             states=states,
@@ -196,17 +408,19 @@ class Client:
             sell_delivery_area=sell_delivery_area,
         )
 
-        if public_trade_filter not in self._public_trades_streams:
-            self._public_trades_streams[public_trade_filter] = GrpcStreamingHelper(
-                f"electricity-trading-{public_trade_filter}",
-                lambda: self._stub.ReceivePublicTradesStream(  # type: ignore
-                    electricity_trading_pb2.ReceivePublicTradesStreamRequest(
-                        filter=public_trade_filter.to_pb(),
-                    )
-                ),
-                lambda response: PublicTrade.from_pb(response.public_trade),
+        stream = self._public_trades_streams.get(public_trade_filter)
+        if stream is None:
+            stub = self._next_stub()
+            request = electricity_trading_pb2.ReceivePublicTradesStreamRequest(
+                filter=public_trade_filter.to_pb(),
             )
-        return self._public_trades_streams[public_trade_filter].new_receiver()
+            stream = GrpcStreamingHelper(
+                f"electricity-trading-public-trades-{next(self._stream_ids)}",
+                lambda: stub.ReceivePublicTradesStream(request),  # type: ignore
+                lambda response: self._public_trade_from_pb(response.public_trade),
+            )
+            self._public_trades_streams[public_trade_filter] = stream
+        return stream.new_receiver()
 
     async def create_gridpool_order(  # pylint: disable=too-many-arguments, too-many-locals
         self,
@@ -222,7 +436,7 @@ class Client:
         display_quantity: Energy | None = None,
         execution_option: OrderExecutionOption | None = None,
         valid_until: datetime | None = None,
-        payload: dict[str, struct_pb2.Value] | None = None,
+        payload: dict[str, Any] | None = None,
         tag: str | None = None,
     ) -> OrderDetail:
         """
@@ -263,17 +477,19 @@ class Client:
             tag=tag,
         )
 
-        response = await cast(
-            Awaitable[electricity_trading_pb2.CreateGridpoolOrderResponse],
-            self._stub.CreateGridpoolOrder(
-                electricity_trading_pb2.CreateGridpoolOrderRequest(
-                    gridpool_id=gridpool_id,
-                    order=order.to_pb(),
-                )
-            ),
+        request = await self._build_request(
+            lambda: electricity_trading_pb2.CreateGridpoolOrderRequest(
+                gridpool_id=gridpool_id,
+                order=order.to_pb(),
+            )
         )
 
-        return OrderDetail.from_pb(response.order_detail)
+        response: electricity_trading_pb2.CreateGridpoolOrderResponse = (
+            await self._next_stub().CreateGridpoolOrder(request)  # type: ignore[misc]
+        )
+        self._invalidate_orders(gridpool_id)
+
+        return self._order_detail_from_pb(response.order_detail)
 
     async def update_gridpool_order(  # pylint: disable=too-many-arguments, too-many-locals
         self,
@@ -286,7 +502,7 @@ class Client:
         display_quantity: Energy | None | _Sentinel = NO_VALUE,
         execution_option: OrderExecutionOption | None | _Sentinel = NO_VALUE,
         valid_until: datetime | None | _Sentinel = NO_VALUE,
-        payload: dict[str, struct_pb2.Value] | None | _Sentinel = NO_VALUE,
+        payload: dict[str, Any] | None | _Sentinel = NO_VALUE,
         tag: str | None | _Sentinel = NO_VALUE,
     ) -> OrderDetail:
         """
@@ -317,52 +533,50 @@ class Client:
         Raises:
             ValueError: If no fields to update are provided.
         """
-        params = {
-            "price": price,
-            "quantity": quantity,
-            "stop_price": stop_price,
-            "peak_price_delta": peak_price_delta,
-            "display_quantity": display_quantity,
-            "execution_option": execution_option,
-            "valid_until": valid_until,
-            "payload": payload,
-            "tag": tag,
-        }
-
-        if all(value is NO_VALUE for value in params.values()):
-            raise ValueError("At least one field to update must be provided.")
+        paths: list[str] = []
+        fields: dict[str, Any] = {}
+        for name, value in zip(
+            _UPDATE_ORDER_FIELDS,
+            (
+                price,
+                quantity,
+                stop_price,
+                peak_price_delta,
+                display_quantity,
+                execution_option,
+                valid_until,
+                payload,
+                tag,
+            ),
+        ):
+            if value is not NO_VALUE:
+                paths.append(name)
+                fields[name] = value
 
-        paths = [param for param, value in params.items() if value is not NO_VALUE]
+        if not paths:
+            raise ValueError("At least one field to update must be provided.")
 
         # Field mask specifying which fields should be updated
         # This is used so that we can update parameters with None values
         update_mask = field_mask_pb2.FieldMask(paths=paths)
 
-        update_order_fields = UpdateOrder(
-            price=None if price is NO_VALUE else price,
-            quantity=None if quantity is NO_VALUE else quantity,
-            stop_price=None if stop_price is NO_VALUE else stop_price,
-            peak_price_delta=None if peak_price_delta is NO_VALUE else peak_price_delta,
-            display_quantity=None if display_quantity is NO_VALUE else display_quantity,
-            execution_option=None if execution_option is NO_VALUE else execution_option,
-            valid_until=None if valid_until is NO_VALUE else valid_until,
-            payload=None if payload is NO_VALUE else payload,
-            tag=None if tag is NO_VALUE else tag,
+        update_order_fields = UpdateOrder(**fields)
+
+        request = await self._build_request(
+            lambda: electricity_trading_pb2.UpdateGridpoolOrderRequest(
+                gridpool_id=gridpool_id,
+                order_id=order_id,
+                update_order_fields=update_order_fields.to_pb(),
+                update_mask=update_mask,
+            )
         )
 
-        response = await cast(
-            Awaitable[electricity_trading_pb2.UpdateGridpoolOrderResponse],
-            self._stub.UpdateGridpoolOrder(
-                electricity_trading_pb2.UpdateGridpoolOrderRequest(
-                    gridpool_id=gridpool_id,
-                    order_id=order_id,
-                    update_order_fields=update_order_fields.to_pb(),
-                    update_mask=update_mask,
-                )
-            ),
+        response: electricity_trading_pb2.UpdateGridpoolOrderResponse = (
+            await self._next_stub().UpdateGridpoolOrder(request)  # type: ignore[misc]
         )
+        self._invalidate_orders(gridpool_id)
 
-        return OrderDetail.from_pb(response.order_detail)
+        return self._order_detail_from_pb(response.order_detail)
 
     async def cancel_gridpool_order(
         self, gridpool_id: int, order_id: int
@@ -377,16 +591,15 @@ class Client:
         Returns:
             The cancelled order.
         """
-        response = await cast(
-            Awaitable[electricity_trading_pb2.CancelGridpoolOrderResponse],
-            self._stub.CancelGridpoolOrder(
-                electricity_trading_pb2.CancelGridpoolOrderRequest(
-                    gridpool_id=gridpool_id, order_id=order_id
-                )
-            ),
+        request = electricity_trading_pb2.CancelGridpoolOrderRequest(
+            gridpool_id=gridpool_id, order_id=order_id
+        )
+        response: electricity_trading_pb2.CancelGridpoolOrderResponse = (
+            await self._next_stub().CancelGridpoolOrder(request)  # type: ignore[misc]
         )
+        self._invalidate_orders(gridpool_id)
 
-        return OrderDetail.from_pb(response.order_detail)
+        return self._order_detail_from_pb(response.order_detail)
 
     async def cancel_all_gridpool_orders(self, gridpool_id: int) -> int:
         """
@@ -398,14 +611,15 @@ class Client:
         Returns:
             The ID of the Gridpool for which the orders were cancelled.
         """
-        response = await cast(
-            Awaitable[electricity_trading_pb2.CancelAllGridpoolOrdersResponse],
-            self._stub.CancelAllGridpoolOrders(
-                electricity_trading_pb2.CancelAllGridpoolOrdersRequest(
-                    gridpool_id=gridpool_id
-                )
-            ),
+        request = electricity_trading_pb2.CancelAllGridpoolOrdersRequest(
+            gridpool_id=gridpool_id
         )
+        response: electricity_trading_pb2.CancelAllGridpoolOrdersResponse = (
+            await self._next_stub().CancelAllGridpoolOrders(  # type: ignore[misc]
+                request
+            )
+        )
+        self._invalidate_orders(gridpool_id)
 
         return response.gridpool_id
 
@@ -420,16 +634,19 @@ class Client:
         Returns:
             The order.
         """
-        response = await cast(
-            Awaitable[electricity_trading_pb2.GetGridpoolOrderResponse],
-            self._stub.GetGridpoolOrder(
-                electricity_trading_pb2.GetGridpoolOrderRequest(
-                    gridpool_id=gridpool_id, order_id=order_id
-                )
-            ),
-        )
 
-        return OrderDetail.from_pb(response.order_detail)
+        async def fetch() -> OrderDetail:
+            request = electricity_trading_pb2.GetGridpoolOrderRequest(
+                gridpool_id=gridpool_id, order_id=order_id
+            )
+            response: electricity_trading_pb2.GetGridpoolOrderResponse = (
+                await self._next_stub().GetGridpoolOrder(request)  # type: ignore[misc]
+            )
+            return self._order_detail_from_pb(response.order_detail)
+
+        if self._get_order_cache is None:
+            return await fetch()
+        return await self._get_order_cache.get((gridpool_id, order_id), fetch)
 
     async def list_gridpool_orders(  # pylint: disable=too-many-arguments
         self,
@@ -441,7 +658,7 @@ class Client:
         tag: str | None = None,
         max_nr_orders: int | None = None,
         page_token: str | None = None,
-    ) -> list[OrderDetail]:
+    ) -> Sequence[OrderDetail]:
         """
         List orders for a specific Gridpool with optional filters.
 
@@ -456,7 +673,7 @@ class Client:
             page_token: The page token to use for pagination.
 
         Returns:
-            The list of orders for that gridpool.
+            The orders for that gridpool, converted lazily on first access.
         """
         gridpool_order_filer = GridpoolOrderFilter(
             order_states=order_states,
@@ -471,21 +688,26 @@ class Client:
             page_token=page_token,
         )
 
-        response = await cast(
-            Awaitable[electricity_trading_pb2.ListGridpoolOrdersResponse],
-            self._stub.ListGridpoolOrders(
-                electricity_trading_pb2.ListGridpoolOrdersRequest(
-                    gridpool_id=gridpool_id,
-                    filter=gridpool_order_filer.to_pb(),
-                    pagination_params=pagination_params.to_pb(),
+        async def fetch() -> Sequence[OrderDetail]:
+            request = electricity_trading_pb2.ListGridpoolOrdersRequest(
+                gridpool_id=gridpool_id,
+                filter=gridpool_order_filer.to_pb(),
+                pagination_params=pagination_params.to_pb(),
+            )
+            response: electricity_trading_pb2.ListGridpoolOrdersResponse = (
+                await self._next_stub().ListGridpoolOrders(  # type: ignore[misc]
+                    request
                 )
-            ),
-        )
+            )
+            return _LazyPbSequence(
+                response.order_detail_lists, self._order_detail_from_pb
+            )
 
-        return [
-            OrderDetail.from_pb(order_detail)
-            for order_detail in response.order_detail_lists
-        ]
+        if self._list_orders_cache is None:
+            return await fetch()
+        return await self._list_orders_cache.get(
+            (gridpool_id, gridpool_order_filer, pagination_params), fetch
+        )
 
     async def list_gridpool_trades(  # pylint: disable=too-many-arguments
         self,
@@ -497,7 +719,7 @@ class Client:
         delivery_area: DeliveryArea | None = None,
         max_nr_orders: int | None = None,
         page_token: str | None = None,
-    ) -> list[Trade]:
+    ) -> Sequence[Trade]:
         """
         List trades for a specific Gridpool with optional filters.
 
@@ -512,7 +734,7 @@ class Client:
             page_token: The page token to use for pagination.
 
         Returns:
-            The list of trades for the given gridpool.
+            The trades for the given gridpool, converted lazily on first access.
         """
         gridpool_trade_filter = GridpoolTradeFilter(
             trade_states=trade_states,
@@ -527,18 +749,16 @@ class Client:
             page_token=page_token,
         )
 
-        response = await cast(
-            Awaitable[electricity_trading_pb2.ListGridpoolTradesResponse],
-            self._stub.ListGridpoolTrades(
-                electricity_trading_pb2.ListGridpoolTradesRequest(
-                    gridpool_id=gridpool_id,
-                    filter=gridpool_trade_filter.to_pb(),
-                    pagination_params=pagination_params.to_pb(),
-                )
-            ),
+        request = electricity_trading_pb2.ListGridpoolTradesRequest(
+            gridpool_id=gridpool_id,
+            filter=gridpool_trade_filter.to_pb(),
+            pagination_params=pagination_params.to_pb(),
+        )
+        response: electricity_trading_pb2.ListGridpoolTradesResponse = (
+            await self._next_stub().ListGridpoolTrades(request)  # type: ignore[misc]
         )
 
-        return [Trade.from_pb(trade) for trade in response.trade_lists]
+        return _LazyPbSequence(response.trade_lists, self._trade_from_pb)
 
     async def list_public_trades(  # pylint: disable=too-many-arguments
         self,
@@ -548,7 +768,7 @@ class Client:
         sell_delivery_area: DeliveryArea | None = None,
         max_nr_orders: int | None = None,
         page_token: str | None = None,
-    ) -> list[PublicTrade]:
+    ) -> Sequence[PublicTrade]:
         """
         List all executed public orders with optional filters.
 
@@ -561,7 +781,7 @@ class Client:
             page_token: The page token to use for pagination.
 
         Returns:
-            The list of public trades.
+            The public trades, converted lazily on first access.
         """
         public_trade_filter = PublicTradeFilter(
             states=states,
@@ -575,17 +795,182 @@ class Client:
             page_token=page_token,
         )
 
-        response = await cast(
-            Awaitable[electricity_trading_pb2.ListPublicTradesResponse],
-            self._stub.ListPublicTrades(
-                electricity_trading_pb2.ListPublicTradesRequest(
-                    filter=public_trade_filter.to_pb(),
-                    pagination_params=pagination_params.to_pb(),
-                )
-            ),
+        request = electricity_trading_pb2.ListPublicTradesRequest(
+            filter=public_trade_filter.to_pb(),
+            pagination_params=pagination_params.to_pb(),
+        )
+        response: electricity_trading_pb2.ListPublicTradesResponse = (
+            await self._next_stub().ListPublicTrades(request)  # type: ignore[misc]
         )
 
-        return [
-            PublicTrade.from_pb(public_trade)
-            for public_trade in response.public_trade_lists
-        ]
+        return _LazyPbSequence(response.public_trade_lists, self._public_trade_from_pb)
+
+    async def iter_gridpool_orders(  # pylint: disable=too-many-arguments
+        self,
+        gridpool_id: int,
+        order_states: list[OrderState] | None = None,
+        side: MarketSide | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        delivery_area: DeliveryArea | None = None,
+        tag: str | None = None,
+        max_nr_orders: int | None = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[OrderDetail]:
+        """
+        Iterate over all the orders of a Gridpool, going through all the pages.
+
+        The next pages are fetched while the current one is being iterated.
+
+        Args:
+            gridpool_id: The Gridpool to retrieve the orders for.
+            order_states: List of order states to filter by.
+            side: The side of the market to filter by.
+            delivery_period: The delivery period to filter by.
+            delivery_area: The delivery area to filter by.
+            tag: The tag to filter by.
+            max_nr_orders: The maximum number of orders to fetch per page.
+            prefetch: The number of pages to fetch ahead.
+
+        Yields:
+            The orders for that gridpool.
+        """
+        gridpool_order_filter = GridpoolOrderFilter(
+            order_states=order_states,
+            side=side,
+            delivery_period=delivery_period,
+            delivery_area=delivery_area,
+            tag=tag,
+        ).to_pb()
+
+        async def fetch_page(
+            page_token: str | None,
+        ) -> tuple[Sequence[OrderDetail], str | None]:
+            request = electricity_trading_pb2.ListGridpoolOrdersRequest(
+                gridpool_id=gridpool_id,
+                filter=gridpool_order_filter,
+                pagination_params=PaginationParams(max_nr_orders, page_token).to_pb(),
+            )
+            response: electricity_trading_pb2.ListGridpoolOrdersResponse = (
+                await self._next_stub().ListGridpoolOrders(  # type: ignore[misc]
+                    request
+                )
+            )
+            return (
+                _LazyPbSequence(
+                    response.order_detail_lists, self._order_detail_from_pb
+                ),
+                response.pagination_info.next_page_token,
+            )
+
+        async for order in _iter_pages(fetch_page, prefetch):
+            yield order
+
+    async def iter_gridpool_trades(  # pylint: disable=too-many-arguments
+        self,
+        gridpool_id: int,
+        trade_states: list[TradeState] | None = None,
+        trade_id_lists: list[int] | None = None,
+        market_side: MarketSide | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        delivery_area: DeliveryArea | None = None,
+        max_nr_orders: int | None = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[Trade]:
+        """
+        Iterate over all the trades of a Gridpool, going through all the pages.
+
+        The next pages are fetched while the current one is being iterated.
+
+        Args:
+            gridpool_id: The Gridpool to retrieve the trades for.
+            trade_states: List of trade states to filter by.
+            trade_id_lists: List of trade IDs to filter by.
+            market_side: The side of the market to filter by.
+            delivery_period: The delivery period to filter by.
+            delivery_area: The delivery area to filter by.
+            max_nr_orders: The maximum number of trades to fetch per page.
+            prefetch: The number of pages to fetch ahead.
+
+        Yields:
+            The trades for that gridpool.
+        """
+        gridpool_trade_filter = GridpoolTradeFilter(
+            trade_states=trade_states,
+            trade_id_lists=trade_id_lists,
+            side=market_side,
+            delivery_period=delivery_period,
+            delivery_area=delivery_area,
+        ).to_pb()
+
+        async def fetch_page(
+            page_token: str | None,
+        ) -> tuple[Sequence[Trade], str | None]:
+            request = electricity_trading_pb2.ListGridpoolTradesRequest(
+                gridpool_id=gridpool_id,
+                filter=gridpool_trade_filter,
+                pagination_params=PaginationParams(max_nr_orders, page_token).to_pb(),
+            )
+            response: electricity_trading_pb2.ListGridpoolTradesResponse = (
+                await self._next_stub().ListGridpoolTrades(  # type: ignore[misc]
+                    request
+                )
+            )
+            return (
+                _LazyPbSequence(response.trade_lists, self._trade_from_pb),
+                response.pagination_info.next_page_token,
+            )
+
+        async for trade in _iter_pages(fetch_page, prefetch):
+            yield trade
+
+    async def iter_public_trades(  # pylint: disable=too-many-arguments
+        self,
+        states: list[TradeState] | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        buy_delivery_area: DeliveryArea | None = None,
+        sell_delivery_area: DeliveryArea | None = None,
+        max_nr_orders: int | None = None,
+        prefetch: int = 2,
+    ) -> AsyncIterator[PublicTrade]:
+        """
+        Iterate over all executed public trades, going through all the pages.
+
+        The next pages are fetched while the current one is being iterated.
+
+        Args:
+            states: List of trade states to filter by.
+            delivery_period: The delivery period to filter by.
+            buy_delivery_area: The buy delivery area to filter by.
+            sell_delivery_area: The sell delivery area to filter by.
+            max_nr_orders: The maximum number of trades to fetch per page.
+            prefetch: The number of pages to fetch ahead.
+
+        Yields:
+            The public trades.
+        """
+        public_trade_filter = PublicTradeFilter(
+            states=states,
+            delivery_period=delivery_period,
+            buy_delivery_area=buy_delivery_area,
+            sell_delivery_area=sell_delivery_area,
+        ).to_pb()
+
+        async def fetch_page(
+            page_token: str | None,
+        ) -> tuple[Sequence[PublicTrade], str | None]:
+            request = electricity_trading_pb2.ListPublicTradesRequest(
+                filter=public_trade_filter,
+                pagination_params=PaginationParams(max_nr_orders, page_token).to_pb(),
+            )
+            response: electricity_trading_pb2.ListPublicTradesResponse = (
+                await self._next_stub().ListPublicTrades(request)  # type: ignore[misc]
+            )
+            return (
+                _LazyPbSequence(
+                    response.public_trade_lists, self._public_trade_from_pb
+                ),
+                response.pagination_info.next_page_token,
+            )
+
+        async for public_trade in _iter_pages(fetch_page, prefetch):
+            yield public_trade
@@ -8,24 +8,150 @@
 from __future__ import annotations  # required for constructor type hinting
 
 import enum
+import functools
 import logging
+from collections.abc import Callable, Iterator, Sequence
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Self
+from typing import Any, Generic, Self, TypeVar, overload
 
 from frequenz.api.common.v1.grid import delivery_area_pb2, delivery_duration_pb2
 from frequenz.api.common.v1.market import energy_pb2, price_pb2
 from frequenz.api.common.v1.pagination import pagination_params_pb2
 from frequenz.api.electricity_trading.v1 import electricity_trading_pb2
-from google.protobuf import json_format, struct_pb2, timestamp_pb2
+from google.protobuf import struct_pb2, timestamp_pb2
 from google.type import decimal_pb2
 
 _logger = logging.getLogger(__name__)
 
+_PbT = TypeVar("_PbT")
+_T = TypeVar("_T")
+
+
+@functools.lru_cache(maxsize=4096)
+def _decimal(value: str) -> Decimal:
+    """Parse a decimal string, reusing the result for recently seen strings.
+
+    Prices and quantities repeat a lot (e.g. tick-aligned price levels), and as
+    `Decimal`s are immutable, the parsed objects can be shared.
+
+    Args:
+        value: The string to parse.
+
+    Returns:
+        The parsed decimal.
+    """
+    return Decimal(value)
+
+
+def _to_timestamp(dt: datetime) -> timestamp_pb2.Timestamp:
+    """Convert a datetime to a protobuf Timestamp.
+
+    Args:
+        dt: The datetime to convert. Naive datetimes are taken as UTC.
+
+    Returns:
+        The Timestamp corresponding to the datetime.
+    """
+    timestamp = timestamp_pb2.Timestamp()
+    timestamp.FromDatetime(dt)
+    return timestamp
+
+
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _from_timestamp(timestamp: timestamp_pb2.Timestamp) -> datetime:
+    """Convert a protobuf Timestamp to a naive UTC datetime.
+
+    This gives the same result as `Timestamp.ToDatetime()`, but without its
+    Python-level validation and rounding helpers, which make it slower.
+
+    Args:
+        timestamp: The Timestamp to convert.
+
+    Returns:
+        The datetime corresponding to the Timestamp.
+    """
+    return _EPOCH + timedelta(
+        seconds=timestamp.seconds, microseconds=timestamp.nanos // 1000
+    )
+
+
+def _value_to_python(value: struct_pb2.Value) -> Any:
+    """Convert a protobuf Value to the corresponding plain Python object.
+
+    Args:
+        value: The Value to convert.
+
+    Returns:
+        The value as a `dict`, `list`, `str`, `float`, `bool` or `None`.
+    """
+    kind = value.WhichOneof("kind")
+    if kind == "struct_value":
+        return _struct_to_dict(value.struct_value)
+    if kind == "list_value":
+        return [_value_to_python(item) for item in value.list_value.values]
+    if kind is None or kind == "null_value":
+        return None
+    return getattr(value, kind)
+
+
+def _struct_to_dict(struct: struct_pb2.Struct) -> dict[str, Any]:
+    """Convert a protobuf Struct to a plain Python dict.
+
+    This gives the same result as `json_format.MessageToDict()`, without going
+    through its generic message handling.
+
+    Args:
+        struct: The Struct to convert.
+
+    Returns:
+        The dict corresponding to the Struct.
+    """
+    return {key: _value_to_python(value) for key, value in struct.fields.items()}
+
+
+def _dict_to_struct(payload: dict[str, Any]) -> struct_pb2.Struct:
+    """Convert a plain Python dict to a protobuf Struct.
+
+    Args:
+        payload: The dict to convert, with JSON-like values.
+
+    Returns:
+        The Struct corresponding to the dict.
+    """
+    struct = struct_pb2.Struct()
+    struct.update(payload)
+    return struct
+
+
+class _PbEnum(enum.Enum):
+    """Base for the enums wrapping a protobuf enum.
+
+    Subclasses must have an `UNSPECIFIED` member.
+    """
+
+    @classmethod
+    def from_pb(cls, value: int) -> Self:
+        """Convert a protobuf enum value to a member of this enum.
+
+        Args:
+            value: The protobuf value to convert.
+
+        Returns:
+            The member with the given value, or `UNSPECIFIED` if there is none.
+        """
+        member = cls._value2member_map_.get(value)
+        if member is not None:
+            return member  # type: ignore[return-value]
+        _logger.warning("Unknown %s %s. Returning UNSPECIFIED.", cls.__name__, value)
+        return cls["UNSPECIFIED"]
+
 
 # From frequanz.api.common
-class Currency(enum.Enum):
+class Currency(_PbEnum):
     """
     List of supported currencies.
 
@@ -55,32 +181,16 @@ class Currency(enum.Enum):
 
     SGD = price_pb2.Price.Currency.CURRENCY_SGD
 
-    @classmethod
-    def from_pb(cls, currency: price_pb2.Price.Currency.ValueType) -> Self:
-        """Convert a protobuf Currency value to Currency enum.
-
-        Args:
-            currency: Currency to convert.
-
-        Returns:
-            Enum value corresponding to the protobuf message.
-        """
-        if not any(e.value == currency for e in cls):
-            _logger.warning("Unknown currency %s. Returning UNSPECIFIED.", currency)
-            return cls.UNSPECIFIED
-
-        return cls(currency)
-
     def to_pb(self) -> price_pb2.Price.Currency.ValueType:
         """Convert a Currency object to protobuf Currency.
 
         Returns:
             Protobuf message corresponding to the Currency object.
         """
-        return price_pb2.Price.Currency.ValueType(self.value)
+        return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Price:
     """Price of an order."""
 
@@ -101,7 +211,7 @@ class Price:
             Price object corresponding to the protobuf message.
         """
         return cls(
-            amount=Decimal(price.amount.value),
+            amount=_decimal(price.amount.value),
             currency=Currency.from_pb(price.currency),
         )
 
@@ -111,12 +221,13 @@ class Price:
         Returns:
             Protobuf message corresponding to the Price object.
         """
-        decimal_amount = decimal_pb2.Decimal()
-        decimal_amount.value = str(self.amount)
-        return price_pb2.Price(amount=decimal_amount, currency=self.currency.to_pb())
+        return price_pb2.Price(
+            amount=decimal_pb2.Decimal(value=str(self.amount)),
+            currency=self.currency.to_pb(),
+        )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Energy:
     """Represents energy unit in Megawatthours (MWh)."""
 
@@ -132,7 +243,7 @@ class Energy:
         Returns:
             Energy object corresponding to the protobuf message.
         """
-        return cls(mwh=Decimal(energy.mwh.value))
+        return cls(mwh=_decimal(energy.mwh.value))
 
     def to_pb(self) -> energy_pb2.Energy:
         """Convert a Energy object to protobuf Energy.
@@ -140,12 +251,10 @@ class Energy:
         Returns:
             Protobuf message corresponding to the Energy object.
         """
-        decimal_mwh = decimal_pb2.Decimal()
-        decimal_mwh.value = str(self.mwh)
-        return energy_pb2.Energy(mwh=decimal_mwh)
+        return energy_pb2.Energy(mwh=decimal_pb2.Decimal(value=str(self.mwh)))
 
 
-class EnergyMarketCodeType(enum.Enum):
+class EnergyMarketCodeType(_PbEnum):
     """
     Specifies the type of identification code used in the energy market.
 
@@ -167,37 +276,16 @@ class EnergyMarketCodeType(enum.Enum):
     US_NERC = delivery_area_pb2.EnergyMarketCodeType.ENERGY_MARKET_CODE_TYPE_US_NERC
     """North American Electric Reliability Corporation identifiers."""
 
-    @classmethod
-    def from_pb(
-        cls, energy_market_code_type: delivery_area_pb2.EnergyMarketCodeType.ValueType
-    ) -> Self:
-        """Convert a protobuf EnergyMarketCodeType value to EnergyMarketCodeType enum.
-
-        Args:
-            energy_market_code_type: Energy market code type to convert.
-
-        Returns:
-            Enum value corresponding to the protobuf message.
-        """
-        if not any(e.value == energy_market_code_type for e in cls):
-            _logger.warning(
-                "Unknown energy market code type %s. Returning UNSPECIFIED.",
-                energy_market_code_type,
-            )
-            return cls.UNSPECIFIED
-
-        return cls(energy_market_code_type)
-
     def to_pb(self) -> delivery_area_pb2.EnergyMarketCodeType.ValueType:
         """Convert a EnergyMarketCodeType object to protobuf EnergyMarketCodeType.
 
         Returns:
             Protobuf message corresponding to the EnergyMarketCodeType object.
         """
-        return delivery_area_pb2.EnergyMarketCodeType.ValueType(self.value)
+        return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeliveryArea:
     """
     Geographical or administrative region.
@@ -220,12 +308,29 @@ class DeliveryArea:
             delivery_area: DeliveryArea to convert.
 
         Returns:
-            DeliveryArea object corresponding to the protobuf message.
+            DeliveryArea object corresponding to the protobuf message, shared
+                between calls for the same area.
         """
-        return cls(
-            code=delivery_area.code,
-            code_type=EnergyMarketCodeType.from_pb(delivery_area.code_type),
-        )
+        return cls._interned(delivery_area.code, delivery_area.code_type)
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _interned(
+        cls, code: str, code_type: delivery_area_pb2.EnergyMarketCodeType.ValueType
+    ) -> Self:
+        """Get the DeliveryArea for a code, reusing the object for known areas.
+
+        There are only a few delivery areas in use, and the objects are immutable,
+        so they can be shared instead of being created for every message.
+
+        Args:
+            code: Code of the delivery area.
+            code_type: Protobuf type of the code.
+
+        Returns:
+            The DeliveryArea object.
+        """
+        return cls(code=code, code_type=EnergyMarketCodeType.from_pb(code_type))
 
     def to_pb(self) -> delivery_area_pb2.DeliveryArea:
         """Convert a DeliveryArea object to protobuf DeliveryArea.
@@ -238,7 +343,7 @@ class DeliveryArea:
         )
 
 
-class DeliveryDuration(enum.Enum):
+class DeliveryDuration(_PbEnum):
     """
     Specifies the time increment, in minutes, used for electricity deliveries and trading.
 
@@ -261,36 +366,30 @@ class DeliveryDuration(enum.Enum):
     MINUTES_60 = delivery_duration_pb2.DeliveryDuration.DELIVERY_DURATION_60
     """1-hour contract duration."""
 
-    @classmethod
-    def from_pb(
-        cls, delivery_duration: delivery_duration_pb2.DeliveryDuration.ValueType
-    ) -> Self:
-        """Convert a protobuf DeliveryDuration value to DeliveryDuration enum.
-
-        Args:
-            delivery_duration: Delivery duration to convert.
-
-        Returns:
-            Enum value corresponding to the protobuf message.
-        """
-        if not any(e.value == delivery_duration for e in cls):
-            _logger.warning(
-                "Unknown delivery duration %s. Returning UNSPECIFIED.",
-                delivery_duration,
-            )
-            return cls.UNSPECIFIED
-
-        return cls(delivery_duration)
-
     def to_pb(self) -> delivery_duration_pb2.DeliveryDuration.ValueType:
         """Convert a DeliveryDuration object to protobuf DeliveryDuration.
 
         Returns:
             Protobuf message corresponding to the DeliveryDuration object.
         """
-        return delivery_duration_pb2.DeliveryDuration.ValueType(self.value)
+        return self.value
 
 
+_DURATION_FROM_TIMEDELTA: dict[timedelta, DeliveryDuration] = {
+    timedelta(minutes=5): DeliveryDuration.MINUTES_5,
+    timedelta(minutes=15): DeliveryDuration.MINUTES_15,
+    timedelta(minutes=30): DeliveryDuration.MINUTES_30,
+    timedelta(minutes=60): DeliveryDuration.MINUTES_60,
+}
+"""The delivery durations supported by `DeliveryPeriod`, by their length."""
+
+_DURATION_FROM_PB: dict[int, DeliveryDuration] = {
+    duration.value: duration for duration in _DURATION_FROM_TIMEDELTA.values()
+}
+"""The delivery durations supported by `DeliveryPeriod`, by their protobuf value."""
+
+
+@dataclass(frozen=True, slots=True, init=False)
 class DeliveryPeriod:
     """
     Time period during which the contract is delivered.
@@ -309,33 +408,45 @@ class DeliveryPeriod:
     def __init__(
         self,
         start: datetime,
-        duration: timedelta,
+        duration: timedelta | DeliveryDuration,
     ) -> None:
         """
         Initialize the DeliveryPeriod object.
 
         Args:
             start: Start UTC timestamp represents the beginning of the delivery period.
-            duration: The length of the delivery period.
+            duration: The length of the delivery period. A `DeliveryDuration` is
+                also accepted, so `dataclasses.replace()` works on the object.
 
         Raises:
             ValueError: If the duration is not 5, 15, 30, or 60 minutes.
         """
-        self.start = start
-        minutes = duration.total_seconds() / 60
-        match minutes:
-            case 5:
-                self.duration = DeliveryDuration.MINUTES_5
-            case 15:
-                self.duration = DeliveryDuration.MINUTES_15
-            case 30:
-                self.duration = DeliveryDuration.MINUTES_30
-            case 60:
-                self.duration = DeliveryDuration.MINUTES_60
-            case _:
-                raise ValueError(
-                    "Invalid duration value. Duration must be 5, 15, 30, or 60 minutes."
-                )
+        if isinstance(duration, DeliveryDuration):
+            delivery_duration = _DURATION_FROM_PB.get(duration.value)
+        else:
+            delivery_duration = _DURATION_FROM_TIMEDELTA.get(duration)
+        if delivery_duration is None:
+            raise ValueError(
+                "Invalid duration value. Duration must be 5, 15, 30, or 60 minutes."
+            )
+        object.__setattr__(self, "start", start)
+        object.__setattr__(self, "duration", delivery_duration)
+
+    @classmethod
+    def _from_duration(cls, start: datetime, duration: DeliveryDuration) -> Self:
+        """Create a DeliveryPeriod from an already validated delivery duration.
+
+        Args:
+            start: Start UTC timestamp represents the beginning of the delivery period.
+            duration: The delivery duration, which must be a supported one.
+
+        Returns:
+            The DeliveryPeriod object.
+        """
+        delivery_period = cls.__new__(cls)
+        object.__setattr__(delivery_period, "start", start)
+        object.__setattr__(delivery_period, "duration", duration)
+        return delivery_period
 
     @classmethod
     def from_pb(cls, delivery_period: delivery_duration_pb2.DeliveryPeriod) -> Self:
@@ -345,28 +456,45 @@ class DeliveryPeriod:
             delivery_period: DeliveryPeriod to convert.
 
         Returns:
-            DeliveryPeriod object corresponding to the protobuf message.
+            DeliveryPeriod object corresponding to the protobuf message, shared
+                between calls for the same period.
+        """
+        start = delivery_period.start
+        return cls._interned(start.seconds, start.nanos, delivery_period.duration)
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _interned(
+        cls,
+        seconds: int,
+        nanos: int,
+        duration: delivery_duration_pb2.DeliveryDuration.ValueType,
+    ) -> Self:
+        """Get the DeliveryPeriod for a start and duration, reusing recent objects.
+
+        Many orders and trades are for the same few delivery periods, and the
+        objects are immutable, so they can be shared instead of being created for
+        every message.
+
+        Args:
+            seconds: Seconds of the start timestamp since the Unix epoch.
+            nanos: Nanoseconds of the start timestamp.
+            duration: Protobuf delivery duration.
+
+        Returns:
+            The DeliveryPeriod object.
 
         Raises:
             ValueError: If the duration is not 5, 15, 30, or 60 minutes.
         """
-        start = delivery_period.start.ToDatetime()
-        delivery_duration_enum = DeliveryDuration.from_pb(delivery_period.duration)
-
-        match delivery_duration_enum:
-            case DeliveryDuration.MINUTES_5:
-                duration = timedelta(minutes=5)
-            case DeliveryDuration.MINUTES_15:
-                duration = timedelta(minutes=15)
-            case DeliveryDuration.MINUTES_30:
-                duration = timedelta(minutes=30)
-            case DeliveryDuration.MINUTES_60:
-                duration = timedelta(minutes=60)
-            case _:
-                raise ValueError(
-                    "Invalid duration value. Duration must be 5, 15, 30, or 60 minutes."
-                )
-        return cls(start=start, duration=duration)
+        # Looked up by the raw value, as only the supported durations are valid here
+        delivery_duration = _DURATION_FROM_PB.get(duration)
+        if delivery_duration is None:
+            raise ValueError(
+                "Invalid duration value. Duration must be 5, 15, 30, or 60 minutes."
+            )
+        start = _EPOCH + timedelta(seconds=seconds, microseconds=nanos // 1000)
+        return cls._from_duration(start, delivery_duration)
 
     def to_pb(self) -> delivery_duration_pb2.DeliveryPeriod:
         """Convert a DeliveryPeriod object to protobuf DeliveryPeriod.
@@ -374,15 +502,13 @@ class DeliveryPeriod:
         Returns:
             Protobuf message corresponding to the DeliveryPeriod object.
         """
-        start = timestamp_pb2.Timestamp()
-        start.FromDatetime(self.start)
-        return delivery_duration_pb2.DeliveryPeriod(
-            start=start,
-            duration=self.duration.to_pb(),
-        )
+        # Filling the fields in place avoids copying a separate Timestamp
+        pb = delivery_duration_pb2.DeliveryPeriod(duration=self.duration.to_pb())
+        pb.start.FromDatetime(self.start)
+        return pb
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PaginationParams:
     """Parameters for paginating list requests."""
 
@@ -422,7 +548,7 @@ class PaginationParams:
 # From electricity trading api
 
 
-class OrderExecutionOption(enum.Enum):
+class OrderExecutionOption(_PbEnum):
     """
     Specific behavior for the execution of an order.
 
@@ -448,38 +574,16 @@ class OrderExecutionOption(enum.Enum):
     """Immediate or Cancel: Any portion of an order that cannot be filled \
     immediately will be cancelled."""
 
-    @classmethod
-    def from_pb(
-        cls,
-        order_execution_option: electricity_trading_pb2.OrderExecutionOption.ValueType,
-    ) -> Self:
-        """Convert a protobuf OrderExecutionOption value to OrderExecutionOption enum.
-
-        Args:
-            order_execution_option: order execution option to convert.
-
-        Returns:
-            Enum value corresponding to the protobuf message.
-        """
-        if not any(e.value == order_execution_option for e in OrderExecutionOption):
-            _logger.warning(
-                "Unknown forecast feature %s. Returning UNSPECIFIED.",
-                order_execution_option,
-            )
-            return cls.UNSPECIFIED
-
-        return OrderExecutionOption(order_execution_option)
-
     def to_pb(self) -> electricity_trading_pb2.OrderExecutionOption.ValueType:
         """Convert a OrderExecutionOption object to protobuf OrderExecutionOption.
 
         Returns:
             Protobuf message corresponding to the OrderExecutionOption object.
         """
-        return electricity_trading_pb2.OrderExecutionOption.ValueType(self.value)
+        return self.value
 
 
-class OrderType(enum.Enum):
+class OrderType(_PbEnum):
     """Type of the order (specifies how the order is to be executed in the market)."""
 
     UNSPECIFIED = electricity_trading_pb2.OrderType.ORDER_TYPE_UNSPECIFIED
@@ -513,22 +617,6 @@ class OrderType(enum.Enum):
     """Private and confidential trade, not visible in the public
     order book and has no market impact. (Not yet supported)."""
 
-    @classmethod
-    def from_pb(cls, order_type: electricity_trading_pb2.OrderType.ValueType) -> Self:
-        """Convert a protobuf OrderType value to OrderType enum.
-
-        Args:
-            order_type: Order type to convert.
-
-        Returns:
-            Enum value corresponding to the protobuf message.
-        """
-        if not any(e.value == order_type for e in cls):
-            _logger.warning("Unknown order type %s. Returning UNSPECIFIED.", order_type)
-            return cls.UNSPECIFIED
-
-        return cls(order_type)
-
     def to_pb(self) -> electricity_trading_pb2.OrderType.ValueType:
         """Convert an OrderType enum to protobuf OrderType value.
 
@@ -538,7 +626,7 @@ class OrderType(enum.Enum):
         return self.value
 
 
-class MarketSide(enum.Enum):
+class MarketSide(_PbEnum):
     """Which side of the market the order is on, either buying or selling."""
 
     UNSPECIFIED = electricity_trading_pb2.MarketSide.MARKET_SIDE_UNSPECIFIED
@@ -550,24 +638,6 @@ class MarketSide(enum.Enum):
     SELL = electricity_trading_pb2.MarketSide.MARKET_SIDE_SELL
     """Order to sell electricity, referred to as an 'ask' or 'offer' in the order book."""
 
-    @classmethod
-    def from_pb(cls, market_side: electricity_trading_pb2.MarketSide.ValueType) -> Self:
-        """Convert a protobuf MarketSide value to MarketSide enum.
-
-        Args:
-            market_side: Market side to convert.
-
-        Returns:
-            Enum value corresponding to the protobuf message.
-        """
-        if not any(e.value == market_side for e in cls):
-            _logger.warning(
-                "Unknown market side %s. Returning UNSPECIFIED.", market_side
-            )
-            return cls.UNSPECIFIED
-
-        return cls(market_side)
-
     def to_pb(self) -> electricity_trading_pb2.MarketSide.ValueType:
         """Convert a MarketSide enum to protobuf MarketSide value.
 
@@ -577,7 +647,7 @@ class MarketSide(enum.Enum):
         return self.value
 
 
-class OrderState(enum.Enum):
+class OrderState(_PbEnum):
     """State of an order."""
 
     UNSPECIFIED = electricity_trading_pb2.OrderState.ORDER_STATE_UNSPECIFIED
@@ -618,24 +688,6 @@ class OrderState(enum.Enum):
     """The order has been entered into the system but is not currently exposed to the market. This
     could be due to certain conditions not yet being met."""
 
-    @classmethod
-    def from_pb(cls, order_state: electricity_trading_pb2.OrderState.ValueType) -> Self:
-        """Convert a protobuf OrderState value to OrderState enum.
-
-        Args:
-            order_state: Order state to convert.
-
-        Returns:
-            Enum value corresponding to the protobuf message.
-        """
-        if not any(e.value == order_state for e in cls):
-            _logger.warning(
-                "Unknown order state %s. Returning UNSPECIFIED.", order_state
-            )
-            return cls.UNSPECIFIED
-
-        return cls(order_state)
-
     def to_pb(self) -> electricity_trading_pb2.OrderState.ValueType:
         """Convert an OrderState enum to protobuf OrderState value.
 
@@ -645,7 +697,7 @@ class OrderState(enum.Enum):
         return self.value
 
 
-class TradeState(enum.Enum):
+class TradeState(_PbEnum):
     """State of a trade."""
 
     UNSPECIFIED = electricity_trading_pb2.TradeState.TRADE_STATE_UNSPECIFIED
@@ -679,24 +731,6 @@ class TradeState(enum.Enum):
     )
     """An approval has been requested."""
 
-    @classmethod
-    def from_pb(cls, trade_state: electricity_trading_pb2.TradeState.ValueType) -> Self:
-        """Convert a protobuf TradeState value to TradeState enum.
-
-        Args:
-            trade_state: The trade state to convert.
-
-        Returns:
-            Enum value corresponding to the protobuf message.
-        """
-        if not any(e.value == trade_state for e in cls):
-            _logger.warning(
-                "Unknown trade state %s. Returning UNSPECIFIED.", trade_state
-            )
-            return cls.UNSPECIFIED
-
-        return cls(trade_state)
-
     def to_pb(self) -> electricity_trading_pb2.TradeState.ValueType:
         """Convert a TradeState enum to protobuf TradeState value.
 
@@ -706,7 +740,7 @@ class TradeState(enum.Enum):
         return self.value
 
 
-class StateReason(enum.Enum):
+class StateReason(_PbEnum):
     """Reason that led to a state change."""
 
     UNSPECIFIED = (
@@ -777,27 +811,6 @@ class StateReason(enum.Enum):
     )
     """A quote was partially executed."""
 
-    @classmethod
-    def from_pb(
-        cls,
-        state_reason: electricity_trading_pb2.OrderDetail.StateDetail.StateReason.ValueType,
-    ) -> Self:
-        """Convert a protobuf StateReason value to StateReason enum.
-
-        Args:
-            state_reason: State reason to convert.
-
-        Returns:
-            Enum value corresponding to the protobuf message.
-        """
-        if not any(e.value == state_reason for e in cls):
-            _logger.warning(
-                "Unknown state reason %s. Returning UNSPECIFIED.", state_reason
-            )
-            return cls.UNSPECIFIED
-
-        return cls(state_reason)
-
     def to_pb(
         self,
     ) -> electricity_trading_pb2.OrderDetail.StateDetail.StateReason.ValueType:
@@ -809,7 +822,7 @@ class StateReason(enum.Enum):
         return self.value
 
 
-class MarketActor(enum.Enum):
+class MarketActor(_PbEnum):
     """Actors responsible for an order state change."""
 
     UNSPECIFIED = (
@@ -830,27 +843,6 @@ class MarketActor(enum.Enum):
     )
     """The system was the actor."""
 
-    @classmethod
-    def from_pb(
-        cls,
-        market_actor: electricity_trading_pb2.OrderDetail.StateDetail.MarketActor.ValueType,
-    ) -> Self:
-        """Convert a protobuf MarketActor value to MarketActor enum.
-
-        Args:
-            market_actor: Market actor to convert.
-
-        Returns:
-            Enum value corresponding to the protobuf message.
-        """
-        if not any(e.value == market_actor for e in cls):
-            _logger.warning(
-                "Unknown market actor %s. Returning UNSPECIFIED.", market_actor
-            )
-            return cls.UNSPECIFIED
-
-        return cls(market_actor)
-
     def to_pb(
         self,
     ) -> electricity_trading_pb2.OrderDetail.StateDetail.MarketActor.ValueType:
@@ -862,7 +854,7 @@ class MarketActor(enum.Enum):
         return self.value
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Order:  # pylint: disable=too-many-instance-attributes
     """Represents an order in the electricity market."""
 
@@ -901,9 +893,9 @@ class Order:  # pylint: disable=too-many-instance-attributes
     valid_until: datetime | None = None
     """UTC timestamp defining the time after which the order should be cancelled if not filled."""
 
-    payload: dict[str, struct_pb2.Value] | None = None
-    """User-defined payload individual to a specific order. This can be any data that needs to be
-    associated with the order."""
+    payload: dict[str, Any] | None = None
+    """User-defined payload individual to a specific order. This can be any JSON-like data
+    that needs to be associated with the order."""
 
     tag: str | None = None
     """User-defined tag to group related orders."""
@@ -937,8 +929,12 @@ class Order:  # pylint: disable=too-many-instance-attributes
             execution_option=OrderExecutionOption.from_pb(order.execution_option)
             if order.HasField("execution_option")
             else None,
-            valid_until=order.valid_until.ToDatetime() if order.valid_until else None,
-            payload=json_format.MessageToDict(order.payload) if order.payload else None,
+            valid_until=_from_timestamp(order.valid_until)
+            if order.HasField("valid_until")
+            else None,
+            payload=_struct_to_dict(order.payload)
+            if order.HasField("payload")
+            else None,
             tag=order.tag if order.tag else None,
         )
 
@@ -949,16 +945,11 @@ class Order:  # pylint: disable=too-many-instance-attributes
         Returns:
             Protobuf message corresponding to the Order object.
         """
-        if self.valid_until:
-            valid_until = timestamp_pb2.Timestamp()
-            valid_until.FromDatetime(self.valid_until)
-        else:
-            valid_until = None
         return electricity_trading_pb2.Order(
             delivery_area=self.delivery_area.to_pb(),
             delivery_period=self.delivery_period.to_pb(),
-            type=electricity_trading_pb2.OrderType.ValueType(self.type.value),
-            side=electricity_trading_pb2.MarketSide.ValueType(self.side.value),
+            type=self.type.to_pb(),
+            side=self.side.to_pb(),
             price=self.price.to_pb(),
             quantity=self.quantity.to_pb(),
             stop_price=self.stop_price.to_pb() if self.stop_price else None,
@@ -969,19 +960,15 @@ class Order:  # pylint: disable=too-many-instance-attributes
             if self.display_quantity
             else None,
             execution_option=(
-                electricity_trading_pb2.OrderExecutionOption.ValueType(
-                    self.execution_option.value
-                )
-                if self.execution_option
-                else None
+                self.execution_option.to_pb() if self.execution_option else None
             ),
-            valid_until=valid_until,
-            payload=struct_pb2.Struct(fields=self.payload) if self.payload else None,
+            valid_until=_to_timestamp(self.valid_until) if self.valid_until else None,
+            payload=_dict_to_struct(self.payload) if self.payload else None,
             tag=self.tag if self.tag else None,
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Trade:  # pylint: disable=too-many-instance-attributes
     """Represents a private trade in the electricity market."""
 
@@ -1029,7 +1016,7 @@ class Trade:  # pylint: disable=too-many-instance-attributes
             side=MarketSide.from_pb(trade.side),
             delivery_area=DeliveryArea.from_pb(trade.delivery_area),
             delivery_period=DeliveryPeriod.from_pb(trade.delivery_period),
-            execution_time=trade.execution_time.ToDatetime(),
+            execution_time=_from_timestamp(trade.execution_time),
             price=Price.from_pb(trade.price),
             quantity=Energy.from_pb(trade.quantity),
             state=TradeState.from_pb(trade.state),
@@ -1044,17 +1031,17 @@ class Trade:  # pylint: disable=too-many-instance-attributes
         return electricity_trading_pb2.Trade(
             id=self.id,
             order_id=self.order_id,
-            side=electricity_trading_pb2.MarketSide.ValueType(self.side.value),
+            side=self.side.to_pb(),
             delivery_area=self.delivery_area.to_pb(),
             delivery_period=self.delivery_period.to_pb(),
-            execution_time=timestamp_pb2.Timestamp().FromDatetime(self.execution_time),
+            execution_time=_to_timestamp(self.execution_time),
             price=self.price.to_pb(),
             quantity=self.quantity.to_pb(),
-            state=electricity_trading_pb2.TradeState.ValueType(self.state.value),
+            state=self.state.to_pb(),
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateDetail:
     """Details about the current state of the order."""
 
@@ -1092,17 +1079,13 @@ class StateDetail:
             Protobuf message corresponding to the StateDetail object.
         """
         return electricity_trading_pb2.OrderDetail.StateDetail(
-            state=electricity_trading_pb2.OrderState.ValueType(self.state.value),
-            state_reason=electricity_trading_pb2.OrderDetail.StateDetail.StateReason.ValueType(
-                self.state_reason.value
-            ),
-            market_actor=electricity_trading_pb2.OrderDetail.StateDetail.MarketActor.ValueType(
-                self.market_actor.value
-            ),
+            state=self.state.to_pb(),
+            state_reason=self.state_reason.to_pb(),
+            market_actor=self.market_actor.to_pb(),
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OrderDetail:
     """
     Represents an order with full details, including its ID, state, and associated UTC timestamps.
@@ -1141,8 +1124,8 @@ class OrderDetail:
             state_detail=StateDetail.from_pb(order_detail.state_detail),
             open_quantity=Energy.from_pb(order_detail.open_quantity),
             filled_quantity=Energy.from_pb(order_detail.filled_quantity),
-            create_time=order_detail.create_time.ToDatetime(),
-            modification_time=order_detail.modification_time.ToDatetime(),
+            create_time=_from_timestamp(order_detail.create_time),
+            modification_time=_from_timestamp(order_detail.modification_time),
         )
 
     def to_pb(self) -> electricity_trading_pb2.OrderDetail:
@@ -1157,14 +1140,12 @@ class OrderDetail:
             state_detail=self.state_detail.to_pb(),
             open_quantity=self.open_quantity.to_pb(),
             filled_quantity=self.filled_quantity.to_pb(),
-            create_time=timestamp_pb2.Timestamp().FromDatetime(self.create_time),
-            modification_time=timestamp_pb2.Timestamp().FromDatetime(
-                self.modification_time
-            ),
+            create_time=_to_timestamp(self.create_time),
+            modification_time=_to_timestamp(self.modification_time),
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PublicTrade:  # pylint: disable=too-many-instance-attributes
     """Represents a public order in the market."""
 
@@ -1207,7 +1188,7 @@ class PublicTrade:  # pylint: disable=too-many-instance-attributes
             buy_delivery_area=DeliveryArea.from_pb(public_trade.buy_delivery_area),
             sell_delivery_area=DeliveryArea.from_pb(public_trade.sell_delivery_area),
             delivery_period=DeliveryPeriod.from_pb(public_trade.delivery_period),
-            modification_time=public_trade.modification_time.ToDatetime(),
+            modification_time=_from_timestamp(public_trade.modification_time),
             price=Price.from_pb(public_trade.price),
             quantity=Energy.from_pb(public_trade.quantity),
             state=TradeState.from_pb(public_trade.state),
@@ -1224,20 +1205,18 @@ class PublicTrade:  # pylint: disable=too-many-instance-attributes
             buy_delivery_area=self.buy_delivery_area.to_pb(),
             sell_delivery_area=self.sell_delivery_area.to_pb(),
             delivery_period=self.delivery_period.to_pb(),
-            modification_time=timestamp_pb2.Timestamp().FromDatetime(
-                self.modification_time
-            ),
+            modification_time=_to_timestamp(self.modification_time),
             price=self.price.to_pb(),
             quantity=self.quantity.to_pb(),
-            state=electricity_trading_pb2.TradeState.ValueType(self.state.value),
+            state=self.state.to_pb(),
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GridpoolOrderFilter:
     """Parameters for filtering Gridpool orders."""
 
-    order_states: list[OrderState] | None = None
+    order_states: Sequence[OrderState] | None = None
     """List of order states to filter for."""
 
     side: MarketSide | None = None
@@ -1252,6 +1231,15 @@ class GridpoolOrderFilter:
     tag: str | None = None
     """Tag associated with the orders to be filtered."""
 
+    def __post_init__(self) -> None:
+        """Copy the list fields to tuples.
+
+        This way changes to the lists given by the caller don't affect the filter,
+        which can then be safely used as a dictionary key.
+        """
+        if self.order_states is not None:
+            object.__setattr__(self, "order_states", tuple(self.order_states))
+
     @classmethod
     def from_pb(
         cls, gridpool_order_filter: electricity_trading_pb2.GridpoolOrderFilter
@@ -1264,16 +1252,26 @@ class GridpoolOrderFilter:
         Returns:
             GridpoolOrderFilter object corresponding to the protobuf message.
         """
+        # Unset fields stay None instead of being converted from their defaults.
+        f = gridpool_order_filter
         return cls(
-            order_states=[
-                OrderState.from_pb(state) for state in gridpool_order_filter.states
-            ],
-            side=MarketSide.from_pb(gridpool_order_filter.side),
-            delivery_period=DeliveryPeriod.from_pb(
-                gridpool_order_filter.delivery_period
+            order_states=(
+                [OrderState.from_pb(state) for state in f.states]
+                if len(f.states)
+                else None
             ),
-            delivery_area=DeliveryArea.from_pb(gridpool_order_filter.delivery_area),
-            tag=gridpool_order_filter.tag,
+            side=MarketSide.from_pb(f.side) if f.HasField("side") else None,
+            delivery_period=(
+                DeliveryPeriod.from_pb(f.delivery_period)
+                if f.HasField("delivery_period")
+                else None
+            ),
+            delivery_area=(
+                DeliveryArea.from_pb(f.delivery_area)
+                if f.HasField("delivery_area")
+                else None
+            ),
+            tag=f.tag if f.HasField("tag") else None,
         )
 
     def to_pb(self) -> electricity_trading_pb2.GridpoolOrderFilter:
@@ -1282,32 +1280,31 @@ class GridpoolOrderFilter:
         Returns:
             Protobuf GridpoolOrderFilter corresponding to the object.
         """
-        return electricity_trading_pb2.GridpoolOrderFilter(
-            states=[
-                electricity_trading_pb2.OrderState.ValueType(state.value)
-                for state in self.order_states
-            ]
-            if self.order_states
-            else None,
-            side=electricity_trading_pb2.MarketSide.ValueType(self.side.value)
-            if self.side
-            else None,
-            delivery_period=self.delivery_period.to_pb()
-            if self.delivery_period
-            else None,
-            delivery_area=self.delivery_area.to_pb() if self.delivery_area else None,
-            tag=self.tag if self.tag else None,
-        )
-
-
-@dataclass(frozen=True)
+        # Only set fields are passed, so the message is built in a single call,
+        # and repeated fields are extended afterwards without an interim list.
+        kwargs: dict[str, Any] = {}
+        if self.side:
+            kwargs["side"] = self.side.to_pb()
+        if self.delivery_period:
+            kwargs["delivery_period"] = self.delivery_period.to_pb()
+        if self.delivery_area:
+            kwargs["delivery_area"] = self.delivery_area.to_pb()
+        if self.tag:
+            kwargs["tag"] = self.tag
+        pb = electricity_trading_pb2.GridpoolOrderFilter(**kwargs)
+        if self.order_states:
+            pb.states.extend(state.to_pb() for state in self.order_states)
+        return pb
+
+
+@dataclass(frozen=True, slots=True)
 class GridpoolTradeFilter:
     """Parameters for filtering Gridpool trades."""
 
-    trade_states: list[TradeState] | None = None
+    trade_states: Sequence[TradeState] | None = None
     """List of trade states to filter for."""
 
-    trade_id_lists: list[int] | None = None
+    trade_id_lists: Sequence[int] | None = None
     """List of trade ids to filter for."""
 
     side: MarketSide | None = None
@@ -1319,6 +1316,17 @@ class GridpoolTradeFilter:
     delivery_area: DeliveryArea | None = None
     """Delivery area to filter for."""
 
+    def __post_init__(self) -> None:
+        """Copy the list fields to tuples.
+
+        This way changes to the lists given by the caller don't affect the filter,
+        which can then be safely used as a dictionary key.
+        """
+        if self.trade_states is not None:
+            object.__setattr__(self, "trade_states", tuple(self.trade_states))
+        if self.trade_id_lists is not None:
+            object.__setattr__(self, "trade_id_lists", tuple(self.trade_id_lists))
+
     @classmethod
     def from_pb(
         cls, gridpool_trade_filter: electricity_trading_pb2.GridpoolTradeFilter
@@ -1331,16 +1339,26 @@ class GridpoolTradeFilter:
         Returns:
             GridpoolTradeFilter object corresponding to the protobuf message.
         """
+        # Unset fields stay None instead of being converted from their defaults.
+        f = gridpool_trade_filter
         return cls(
-            trade_states=[
-                TradeState.from_pb(state) for state in gridpool_trade_filter.states
-            ],
-            trade_id_lists=gridpool_trade_filter.trade_id_lists,
-            side=MarketSide.from_pb(gridpool_trade_filter.side),
-            delivery_period=DeliveryPeriod.from_pb(
-                gridpool_trade_filter.delivery_period
+            trade_states=(
+                [TradeState.from_pb(state) for state in f.states]
+                if len(f.states)
+                else None
+            ),
+            trade_id_lists=list(f.trade_id_lists) if len(f.trade_id_lists) else None,
+            side=MarketSide.from_pb(f.side) if f.HasField("side") else None,
+            delivery_period=(
+                DeliveryPeriod.from_pb(f.delivery_period)
+                if f.HasField("delivery_period")
+                else None
+            ),
+            delivery_area=(
+                DeliveryArea.from_pb(f.delivery_area)
+                if f.HasField("delivery_area")
+                else None
             ),
-            delivery_area=DeliveryArea.from_pb(gridpool_trade_filter.delivery_area),
         )
 
     def to_pb(self) -> electricity_trading_pb2.GridpoolTradeFilter:
@@ -1350,24 +1368,26 @@ class GridpoolTradeFilter:
         Returns:
             Protobuf GridpoolTradeFilter corresponding to the object.
         """
-        return electricity_trading_pb2.GridpoolTradeFilter(
-            states=[TradeState.to_pb(state) for state in self.trade_states]
-            if self.trade_states
-            else None,
-            trade_id_lists=self.trade_id_lists if self.trade_id_lists else None,
-            side=MarketSide.to_pb(self.side) if self.side else None,
-            delivery_period=self.delivery_period.to_pb()
-            if self.delivery_period
-            else None,
-            delivery_area=self.delivery_area.to_pb() if self.delivery_area else None,
-        )
-
-
-@dataclass(frozen=True)
+        kwargs: dict[str, Any] = {}
+        if self.side:
+            kwargs["side"] = self.side.to_pb()
+        if self.delivery_period:
+            kwargs["delivery_period"] = self.delivery_period.to_pb()
+        if self.delivery_area:
+            kwargs["delivery_area"] = self.delivery_area.to_pb()
+        pb = electricity_trading_pb2.GridpoolTradeFilter(**kwargs)
+        if self.trade_states:
+            pb.states.extend(state.to_pb() for state in self.trade_states)
+        if self.trade_id_lists:
+            pb.trade_id_lists.extend(self.trade_id_lists)
+        return pb
+
+
+@dataclass(frozen=True, slots=True)
 class PublicTradeFilter:
     """Parameters for filtering the historic, publicly executed orders (trades)."""
 
-    states: list[TradeState] | None = None
+    states: Sequence[TradeState] | None = None
     """List of order states to filter for."""
 
     delivery_period: DeliveryPeriod | None = None
@@ -1379,6 +1399,15 @@ class PublicTradeFilter:
     sell_delivery_area: DeliveryArea | None = None
     """Delivery area to filter for on the sell side."""
 
+    def __post_init__(self) -> None:
+        """Copy the list fields to tuples.
+
+        This way changes to the lists given by the caller don't affect the filter,
+        which can then be safely used as a dictionary key.
+        """
+        if self.states is not None:
+            object.__setattr__(self, "states", tuple(self.states))
+
     @classmethod
     def from_pb(
         cls, public_trade_filter: electricity_trading_pb2.PublicTradeFilter
@@ -1391,14 +1420,28 @@ class PublicTradeFilter:
         Returns:
             PublicTradeFilter object corresponding to the protobuf message.
         """
+        # Unset fields stay None instead of being converted from their defaults.
+        f = public_trade_filter
         return cls(
-            states=[TradeState.from_pb(state) for state in public_trade_filter.states],
-            delivery_period=DeliveryPeriod.from_pb(public_trade_filter.delivery_period),
-            buy_delivery_area=DeliveryArea.from_pb(
-                public_trade_filter.buy_delivery_area
+            states=(
+                [TradeState.from_pb(state) for state in f.states]
+                if len(f.states)
+                else None
             ),
-            sell_delivery_area=DeliveryArea.from_pb(
-                public_trade_filter.sell_delivery_area
+            delivery_period=(
+                DeliveryPeriod.from_pb(f.delivery_period)
+                if f.HasField("delivery_period")
+                else None
+            ),
+            buy_delivery_area=(
+                DeliveryArea.from_pb(f.buy_delivery_area)
+                if f.HasField("buy_delivery_area")
+                else None
+            ),
+            sell_delivery_area=(
+                DeliveryArea.from_pb(f.sell_delivery_area)
+                if f.HasField("sell_delivery_area")
+                else None
             ),
         )
 
@@ -1408,26 +1451,20 @@ class PublicTradeFilter:
         Returns:
             Protobuf PublicTradeFilter corresponding to the object.
         """
-        return electricity_trading_pb2.PublicTradeFilter(
-            states=[
-                electricity_trading_pb2.OrderState.ValueType(state.value)
-                for state in self.states
-            ]
-            if self.states
-            else None,
-            delivery_period=self.delivery_period.to_pb()
-            if self.delivery_period
-            else None,
-            buy_delivery_area=self.buy_delivery_area.to_pb()
-            if self.buy_delivery_area
-            else None,
-            sell_delivery_area=self.sell_delivery_area.to_pb()
-            if self.sell_delivery_area
-            else None,
-        )
-
-
-@dataclass(frozen=True)
+        kwargs: dict[str, Any] = {}
+        if self.delivery_period:
+            kwargs["delivery_period"] = self.delivery_period.to_pb()
+        if self.buy_delivery_area:
+            kwargs["buy_delivery_area"] = self.buy_delivery_area.to_pb()
+        if self.sell_delivery_area:
+            kwargs["sell_delivery_area"] = self.sell_delivery_area.to_pb()
+        pb = electricity_trading_pb2.PublicTradeFilter(**kwargs)
+        if self.states:
+            pb.states.extend(state.to_pb() for state in self.states)
+        return pb
+
+
+@dataclass(frozen=True, slots=True)
 class UpdateOrder:  # pylint: disable=too-many-instance-attributes
     """
     Represents the order properties that can be updated after an order has been placed.
@@ -1461,9 +1498,9 @@ class UpdateOrder:  # pylint: disable=too-many-instance-attributes
     """This is an updated timestamp defining the time after which the order should
     be cancelled if not filled. The timestamp is in UTC."""
 
-    payload: dict[str, struct_pb2.Value] | None = None
-    """Updated user-defined payload individual to a specific order. This can be any data
-    that the user wants to associate with the order."""
+    payload: dict[str, Any] | None = None
+    """Updated user-defined payload individual to a specific order. This can be any JSON-like
+    data that the user wants to associate with the order."""
 
     tag: str | None = None
     """Updated user-defined tag to group related orders."""
@@ -1497,14 +1534,15 @@ class UpdateOrder:  # pylint: disable=too-many-instance-attributes
             display_quantity=Energy.from_pb(update_order.display_quantity)
             if update_order.HasField("display_quantity")
             else None,
+            # The field has no presence, so it is unset when UNSPECIFIED
             execution_option=OrderExecutionOption.from_pb(update_order.execution_option)
-            if update_order.HasField("execution_option")
+            if update_order.execution_option != OrderExecutionOption.UNSPECIFIED.to_pb()
             else None,
-            valid_until=update_order.valid_until.ToDatetime()
+            valid_until=_from_timestamp(update_order.valid_until)
             if update_order.HasField("valid_until")
             else None,
-            payload=json_format.MessageToDict(update_order.payload)
-            if update_order.payload
+            payload=_struct_to_dict(update_order.payload)
+            if update_order.HasField("payload")
             else None,
             tag=update_order.tag if update_order.HasField("tag") else None,
         )
@@ -1515,11 +1553,6 @@ class UpdateOrder:  # pylint: disable=too-many-instance-attributes
         Returns:
             Protobuf UpdateOrder corresponding to the object.
         """
-        if self.valid_until:
-            valid_until = timestamp_pb2.Timestamp()
-            valid_until.FromDatetime(self.valid_until)
-        else:
-            valid_until = None
         return electricity_trading_pb2.UpdateGridpoolOrderRequest.UpdateOrder(
             price=self.price.to_pb() if self.price else None,
             quantity=self.quantity.to_pb() if self.quantity else None,
@@ -1531,13 +1564,96 @@ class UpdateOrder:  # pylint: disable=too-many-instance-attributes
             if self.display_quantity
             else None,
             execution_option=(
-                electricity_trading_pb2.OrderExecutionOption.ValueType(
-                    self.execution_option.value
-                )
-                if self.execution_option
-                else None
-            ),
-            valid_until=valid_until if self.valid_until else None,
-            payload=struct_pb2.Struct(fields=self.payload) if self.payload else None,
+                self.execution_option or OrderExecutionOption.UNSPECIFIED
+            ).to_pb(),
+            valid_until=_to_timestamp(self.valid_until) if self.valid_until else None,
+            payload=_dict_to_struct(self.payload) if self.payload else None,
             tag=self.tag if self.tag else None,
         )
+
+
+class _LazyPbSequence(Sequence[_T], Generic[_PbT, _T]):
+    """A read-only sequence that converts protobuf messages on first access.
+
+    Converted items are memoized, so each message is converted at most once, and
+    messages that are never accessed are never converted.
+    """
+
+    __slots__ = ("_messages", "_from_pb", "_items")
+
+    def __init__(self, messages: Sequence[_PbT], from_pb: Callable[[_PbT], _T]) -> None:
+        """Initialize the sequence.
+
+        Args:
+            messages: The protobuf messages to wrap, usually a repeated field.
+            from_pb: The function used to convert a single message.
+        """
+        self._messages = messages
+        self._from_pb = from_pb
+        self._items: list[_T | None] = [None] * len(messages)
+
+    def __len__(self) -> int:
+        """Get the number of items in the sequence.
+
+        Returns:
+            The number of items.
+        """
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> _T:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[_T]:
+        ...
+
+    def __getitem__(self, index: int | slice) -> _T | Sequence[_T]:
+        """Get one item, or a list of items for a slice, converting them if needed.
+
+        Args:
+            index: The index or slice of the items to get.
+
+        Returns:
+            The converted item, or a list of converted items for a slice.
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        item = self._items[index]
+        if item is None:
+            item = self._items[index] = self._from_pb(self._messages[index])
+        return item
+
+    def __iter__(self) -> Iterator[_T]:
+        """Iterate over the items, converting them if needed.
+
+        Yields:
+            The converted items.
+        """
+        for index in range(len(self._items)):
+            yield self[index]
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the items with those of another sequence, like a list does.
+
+        Args:
+            other: The object to compare with.
+
+        Returns:
+            Whether `other` is a sequence with equal items, in the same order.
+        """
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(
+            item == other_item for item, other_item in zip(self, other)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a string representation of the sequence.
+
+        Returns:
+            The string representation, with all items converted.
+        """
+        return f"{type(self).__name__}({list(self)!r})"
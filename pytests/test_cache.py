@@ -0,0 +1,136 @@
+# License: MIT
+# Copyright © 2024 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the cache of read-only client calls."""
+
+import asyncio
+
+import pytest
+from frequenz.client.electricity_trading._cache import _AsyncTtlCache
+
+
+class _Fetcher:
+    """A fetch function that counts its calls and can be made to wait."""
+
+    def __init__(self) -> None:
+        """Initialize the fetcher."""
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+        self.error: Exception | None = None
+
+    async def __call__(self) -> int:
+        """Fetch a result.
+
+        Returns:
+            The number of the call.
+
+        Raises:
+            Exception: The configured error, if any.
+        """
+        self.calls += 1
+        call = self.calls
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return call
+
+
+def test_concurrent_calls_share_one_fetch() -> None:
+    """Test that calls made while a result is being fetched share it."""
+
+    async def run() -> None:
+        cache: _AsyncTtlCache[str, int] = _AsyncTtlCache(0)
+        fetch = _Fetcher()
+        fetch.release.clear()
+
+        results = asyncio.gather(cache.get("key", fetch), cache.get("key", fetch))
+        await asyncio.sleep(0)
+        fetch.release.set()
+
+        assert list(await results) == [1, 1]
+        assert fetch.calls == 1
+        # With a TTL of 0, the result is not kept once it was fetched
+        assert await cache.get("key", fetch) == 2
+
+    asyncio.run(run())
+
+
+def test_results_expire_after_ttl() -> None:
+    """Test that results are reused for the TTL only."""
+
+    async def run() -> None:
+        cache: _AsyncTtlCache[str, int] = _AsyncTtlCache(0.05)
+        fetch = _Fetcher()
+
+        assert await cache.get("key", fetch) == 1
+        assert await cache.get("key", fetch) == 1
+        assert await cache.get("other", fetch) == 2
+        await asyncio.sleep(0.1)
+        assert await cache.get("key", fetch) == 3
+
+    asyncio.run(run())
+
+
+def test_failures_are_not_cached() -> None:
+    """Test that a failed fetch is retried by the next call."""
+
+    async def run() -> None:
+        cache: _AsyncTtlCache[str, int] = _AsyncTtlCache(60)
+        fetch = _Fetcher()
+        fetch.error = RuntimeError("fetch failed")
+
+        with pytest.raises(RuntimeError, match="fetch failed"):
+            await cache.get("key", fetch)
+
+        fetch.error = None
+        assert await cache.get("key", fetch) == 2
+
+    asyncio.run(run())
+
+
+def test_invalidate_during_fetch() -> None:
+    """Test invalidating a result while it is being fetched."""
+
+    async def run() -> None:
+        cache: _AsyncTtlCache[str, int] = _AsyncTtlCache(60)
+        fetch = _Fetcher()
+        fetch.release.clear()
+
+        first = asyncio.ensure_future(cache.get("key", fetch))
+        await asyncio.sleep(0)
+        cache.invalidate(lambda key: key == "key")
+        second = asyncio.ensure_future(cache.get("key", fetch))
+        await asyncio.sleep(0)
+        fetch.release.set()
+
+        # The first caller still gets its result, later ones get the new fetch
+        assert await first == 1
+        assert await second == 2
+        assert await cache.get("key", fetch) == 2
+        assert fetch.calls == 2
+
+    asyncio.run(run())
+
+
+def test_cancelled_caller_does_not_cancel_fetch() -> None:
+    """Test that cancelling one caller doesn't cancel the fetch for the others."""
+
+    async def run() -> None:
+        cache: _AsyncTtlCache[str, int] = _AsyncTtlCache(60)
+        fetch = _Fetcher()
+        fetch.release.clear()
+
+        cancelled = asyncio.ensure_future(cache.get("key", fetch))
+        waiting = asyncio.ensure_future(cache.get("key", fetch))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        fetch.release.set()
+
+        assert await waiting == 1
+        assert cancelled.cancelled()
+        assert await cache.get("key", fetch) == 1
+        assert fetch.calls == 1
+
+    asyncio.run(run())
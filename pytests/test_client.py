@@ -0,0 +1,421 @@
+# License: MIT
+# Copyright © 2024 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the electricity trading client."""
+
+import asyncio
+import dataclasses
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any
+from unittest import mock
+
+import pytest
+from frequenz.api.electricity_trading.v1 import electricity_trading_pb2
+from frequenz.client.electricity_trading import (
+    Client,
+    Currency,
+    DeliveryArea,
+    DeliveryPeriod,
+    Energy,
+    EnergyMarketCodeType,
+    MarketActor,
+    MarketSide,
+    Order,
+    OrderDetail,
+    OrderState,
+    OrderType,
+    Price,
+    PublicTrade,
+    StateDetail,
+    StateReason,
+    Trade,
+    TradeState,
+    UpdateOrder,
+)
+from frequenz.client.electricity_trading._client import _iter_pages
+from google.protobuf import field_mask_pb2, message
+
+_NOW = datetime(2024, 1, 1, 12, 0)
+
+_ORDER_DETAIL = OrderDetail(
+    order_id=3,
+    order=Order(
+        delivery_area=DeliveryArea(
+            code="10YDE-EON------1", code_type=EnergyMarketCodeType.EUROPE_EIC
+        ),
+        delivery_period=DeliveryPeriod(start=_NOW, duration=timedelta(minutes=15)),
+        type=OrderType.LIMIT,
+        side=MarketSide.BUY,
+        price=Price(amount=Decimal("12.5"), currency=Currency.EUR),
+        quantity=Energy(mwh=Decimal("1.5")),
+    ),
+    state_detail=StateDetail(
+        state=OrderState.ACTIVE,
+        state_reason=StateReason.ADD,
+        market_actor=MarketActor.USER,
+    ),
+    open_quantity=Energy(mwh=Decimal("1.5")),
+    filled_quantity=Energy(mwh=Decimal("0")),
+    create_time=_NOW,
+    modification_time=_NOW,
+)
+
+_TRADE = Trade(
+    id=1,
+    order_id=3,
+    side=MarketSide.BUY,
+    delivery_area=_ORDER_DETAIL.order.delivery_area,
+    delivery_period=_ORDER_DETAIL.order.delivery_period,
+    execution_time=_NOW,
+    price=_ORDER_DETAIL.order.price,
+    quantity=_ORDER_DETAIL.order.quantity,
+    state=TradeState.ACTIVE,
+)
+
+_PUBLIC_TRADE = PublicTrade(
+    public_trade_id=2,
+    buy_delivery_area=_ORDER_DETAIL.order.delivery_area,
+    sell_delivery_area=_ORDER_DETAIL.order.delivery_area,
+    delivery_period=_ORDER_DETAIL.order.delivery_period,
+    modification_time=_NOW,
+    price=_ORDER_DETAIL.order.price,
+    quantity=_ORDER_DETAIL.order.quantity,
+    state=TradeState.ACTIVE,
+)
+
+
+def _make_client(**kwargs: Any) -> tuple[Client, mock.MagicMock]:
+    """Create a client with a mocked stub that answers all unary requests.
+
+    Args:
+        **kwargs: Keyword arguments for the client.
+
+    Returns:
+        The client and its mocked stub.
+    """
+    order_detail = _ORDER_DETAIL.to_pb()
+    stub = mock.MagicMock()
+    stub.CreateGridpoolOrder = mock.AsyncMock(
+        return_value=electricity_trading_pb2.CreateGridpoolOrderResponse(
+            order_detail=order_detail
+        )
+    )
+    stub.UpdateGridpoolOrder = mock.AsyncMock(
+        return_value=electricity_trading_pb2.UpdateGridpoolOrderResponse(
+            order_detail=order_detail
+        )
+    )
+    stub.CancelGridpoolOrder = mock.AsyncMock(
+        return_value=electricity_trading_pb2.CancelGridpoolOrderResponse(
+            order_detail=order_detail
+        )
+    )
+    stub.GetGridpoolOrder = mock.AsyncMock(
+        return_value=electricity_trading_pb2.GetGridpoolOrderResponse(
+            order_detail=order_detail
+        )
+    )
+    stub.ListGridpoolOrders = mock.AsyncMock(
+        return_value=electricity_trading_pb2.ListGridpoolOrdersResponse(
+            order_detail_lists=[order_detail]
+        )
+    )
+    stub.ListGridpoolTrades = mock.AsyncMock(
+        return_value=electricity_trading_pb2.ListGridpoolTradesResponse(
+            trade_lists=[_TRADE.to_pb()]
+        )
+    )
+    stub.ListPublicTrades = mock.AsyncMock(
+        return_value=electricity_trading_pb2.ListPublicTradesResponse(
+            public_trade_lists=[_PUBLIC_TRADE.to_pb()]
+        )
+    )
+    with mock.patch(
+        "frequenz.api.electricity_trading.v1.electricity_trading_pb2_grpc"
+        ".ElectricityTradingServiceStub",
+        return_value=stub,
+    ):
+        client = Client(mock.MagicMock(), **kwargs)
+    return client, stub
+
+
+def test_client_accepts_channel_like_objects() -> None:
+    """Test that any object that is not a sequence is used as a single channel."""
+    channel = mock.MagicMock()
+
+    client = Client(channel)
+
+    channel.unary_unary.assert_called()
+    assert client is not None
+
+
+def test_client_accepts_channel_sequences() -> None:
+    """Test that a sequence of channels is used as a pool."""
+    channels = [mock.MagicMock(), mock.MagicMock()]
+
+    Client(channels)
+
+    for channel in channels:
+        channel.unary_unary.assert_called()
+
+    with pytest.raises(ValueError):
+        Client([])
+
+
+def test_get_order_calls_are_not_merged_by_default() -> None:
+    """Test that without a cache TTL, every call makes its own request."""
+
+    async def run() -> None:
+        client, stub = _make_client()
+
+        results = await asyncio.gather(
+            client.get_gridpool_order(1, 3), client.get_gridpool_order(1, 3)
+        )
+
+        assert list(results) == [_ORDER_DETAIL, _ORDER_DETAIL]
+        assert stub.GetGridpoolOrder.call_count == 2
+
+    asyncio.run(run())
+
+
+def test_get_order_calls_are_cached_with_ttl() -> None:
+    """Test that calls are merged and cached with a TTL, until orders change."""
+
+    async def run() -> None:
+        client, stub = _make_client(orders_cache_ttl=60)
+
+        await asyncio.gather(
+            client.get_gridpool_order(1, 3), client.get_gridpool_order(1, 3)
+        )
+        assert await client.get_gridpool_order(1, 3) == _ORDER_DETAIL
+        assert stub.GetGridpoolOrder.call_count == 1
+
+        await client.cancel_gridpool_order(1, 3)
+        assert await client.get_gridpool_order(1, 3) == _ORDER_DETAIL
+        assert stub.GetGridpoolOrder.call_count == 2
+
+    asyncio.run(run())
+
+
+class _Pages:
+    """A page fetcher over fixed pages, recording the requested tokens."""
+
+    def __init__(self, pages: list[list[int]], error_at: int | None = None) -> None:
+        """Initialize the fetcher.
+
+        Args:
+            pages: The items of each page.
+            error_at: The index of the page whose fetch fails, if any.
+        """
+        self.pages = pages
+        self.error_at = error_at
+        self.tokens: list[str | None] = []
+        self.cancelled = False
+
+    async def __call__(self, page_token: str | None) -> tuple[list[int], str | None]:
+        """Fetch a page.
+
+        Args:
+            page_token: The token of the page, `None` for the first one.
+
+        Returns:
+            The items of the page and the token of the next one.
+
+        Raises:
+            RuntimeError: If the page is configured to fail.
+        """
+        self.tokens.append(page_token)
+        index = int(page_token or 0)
+        try:
+            await asyncio.sleep(0.001)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if index == self.error_at:
+            raise RuntimeError(f"page {index} failed")
+        next_token = str(index + 1) if index + 1 < len(self.pages) else None
+        return self.pages[index], next_token
+
+
+def test_iter_pages_yields_items_in_order() -> None:
+    """Test that the items of all pages are yielded in order."""
+
+    async def run() -> None:
+        fetch_page = _Pages([[1, 2], [3], [], [4, 5]])
+
+        items = [item async for item in _iter_pages(fetch_page, prefetch=2)]
+
+        assert items == [1, 2, 3, 4, 5]
+        assert fetch_page.tokens == [None, "1", "2", "3"]
+
+    asyncio.run(run())
+
+
+def test_iter_pages_raises_fetch_errors() -> None:
+    """Test that a failed page fetch is raised after the previous items."""
+
+    async def run() -> None:
+        fetch_page = _Pages([[1, 2], [3], [4]], error_at=1)
+        items: list[int] = []
+
+        with pytest.raises(RuntimeError, match="page 1 failed"):
+            async for item in _iter_pages(fetch_page, prefetch=2):
+                items.append(item)
+
+        assert items == [1, 2]
+
+    asyncio.run(run())
+
+
+def test_iter_pages_stops_fetching_when_closed() -> None:
+    """Test that the prefetching stops when the consumer stops early."""
+
+    async def run() -> None:
+        fetch_page = _Pages([[index] for index in range(100)])
+        pages = _iter_pages(fetch_page, prefetch=1)
+
+        assert await anext(pages) == 0
+        await pages.aclose()
+        await asyncio.sleep(0.01)
+
+        assert fetch_page.cancelled
+        assert len(fetch_page.tokens) < 5
+
+    asyncio.run(run())
+
+
+def test_iter_pages_rejects_invalid_prefetch() -> None:
+    """Test that at least one page must be prefetched."""
+
+    async def run() -> None:
+        with pytest.raises(ValueError):
+            await anext(_iter_pages(_Pages([[1]]), prefetch=0))
+
+    asyncio.run(run())
+
+
+def test_list_orders_cache_survives_list_changes() -> None:
+    """Test that changing the caller's states list doesn't break the cache."""
+
+    async def run() -> None:
+        client, stub = _make_client(orders_cache_ttl=60)
+        order_states = [OrderState.ACTIVE]
+
+        await client.list_gridpool_orders(1, order_states=order_states)
+        order_states.append(OrderState.CANCELED)
+        await client.list_gridpool_orders(1, order_states=[OrderState.ACTIVE])
+        assert stub.ListGridpoolOrders.call_count == 1
+
+        # Invalidating the cached entries of the Gridpool must not fail
+        await client.cancel_gridpool_order(1, 3)
+        await client.list_gridpool_orders(1, order_states=[OrderState.ACTIVE])
+        assert stub.ListGridpoolOrders.call_count == 2
+
+    asyncio.run(run())
+
+
+def test_raw_mode_returns_protobuf_messages() -> None:
+    """Test that in raw mode, the received messages are returned unconverted."""
+
+    async def response_stream() -> (
+        AsyncIterator[electricity_trading_pb2.ReceiveGridpoolOrdersStreamResponse]
+    ):
+        yield electricity_trading_pb2.ReceiveGridpoolOrdersStreamResponse(
+            order_detail=_ORDER_DETAIL.to_pb()
+        )
+        await asyncio.Event().wait()
+
+    async def run() -> None:
+        client, stub = _make_client(raw=True)
+        stub.ReceiveGridpoolOrdersStream.side_effect = lambda _request: (
+            response_stream()
+        )
+
+        orders = await client.list_gridpool_orders(1)
+        trades = await client.list_gridpool_trades(1)
+        public_trades = await client.list_public_trades()
+        order = await client.get_gridpool_order(1, 3)
+        receiver = client.stream_gridpool_orders(1)
+        streamed_order = await receiver.receive()
+
+        assert list(orders) == [_ORDER_DETAIL.to_pb()]
+        assert list(trades) == [_TRADE.to_pb()]
+        assert list(public_trades) == [_PUBLIC_TRADE.to_pb()]
+        assert order == _ORDER_DETAIL.to_pb()
+        assert streamed_order == _ORDER_DETAIL.to_pb()
+        for item in (orders[0], trades[0], public_trades[0], order, streamed_order):
+            assert isinstance(item, message.Message)
+
+    asyncio.run(run())
+
+
+def test_update_order_sends_given_fields() -> None:
+    """Test that only the given fields are updated, including explicit `None`s."""
+
+    async def run() -> None:
+        client, stub = _make_client()
+        price = Price(amount=Decimal("20"), currency=Currency.EUR)
+
+        updated = await client.update_gridpool_order(
+            1, 3, price=price, valid_until=_NOW, tag=None
+        )
+
+        assert updated == _ORDER_DETAIL
+        request = stub.UpdateGridpoolOrder.call_args.args[0]
+        assert request.gridpool_id == 1
+        assert request.order_id == 3
+        assert list(request.update_mask.paths) == ["price", "valid_until", "tag"]
+        assert request.update_order_fields == (
+            UpdateOrder(price=price, valid_until=_NOW).to_pb()
+        )
+
+        with pytest.raises(ValueError):
+            await client.update_gridpool_order(1, 3)
+        assert stub.UpdateGridpoolOrder.call_count == 1
+
+    asyncio.run(run())
+
+
+@pytest.mark.parametrize("build_requests_in_executor", [False, True])
+def test_requests_built_in_executor(build_requests_in_executor: bool) -> None:
+    """Test that building requests in the executor sends the same requests."""
+
+    async def run() -> None:
+        client, stub = _make_client(
+            build_requests_in_executor=build_requests_in_executor
+        )
+        order = _ORDER_DETAIL.order
+
+        with mock.patch.object(
+            asyncio.get_running_loop(),
+            "run_in_executor",
+            wraps=asyncio.get_running_loop().run_in_executor,
+        ) as run_in_executor:
+            await client.create_gridpool_order(
+                1,
+                order.delivery_area,
+                order.delivery_period,
+                order.type,
+                order.side,
+                order.price,
+                order.quantity,
+                tag="tag",
+            )
+            await client.update_gridpool_order(1, 3, quantity=order.quantity)
+
+        assert run_in_executor.call_count == (2 if build_requests_in_executor else 0)
+        create_request = stub.CreateGridpoolOrder.call_args.args[0]
+        update_request = stub.UpdateGridpoolOrder.call_args.args[0]
+        assert create_request == electricity_trading_pb2.CreateGridpoolOrderRequest(
+            gridpool_id=1, order=dataclasses.replace(order, tag="tag").to_pb()
+        )
+        assert update_request == electricity_trading_pb2.UpdateGridpoolOrderRequest(
+            gridpool_id=1,
+            order_id=3,
+            update_order_fields=UpdateOrder(quantity=order.quantity).to_pb(),
+            update_mask=field_mask_pb2.FieldMask(paths=["quantity"]),
+        )
+
+    asyncio.run(run())
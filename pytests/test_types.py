@@ -0,0 +1,318 @@
+# License: MIT
+# Copyright © 2024 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the types of the electricity trading client."""
+
+import dataclasses
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from frequenz.api.electricity_trading.v1 import electricity_trading_pb2
+from frequenz.client.electricity_trading import (
+    Currency,
+    DeliveryArea,
+    DeliveryDuration,
+    DeliveryPeriod,
+    Energy,
+    EnergyMarketCodeType,
+    GridpoolOrderFilter,
+    GridpoolTradeFilter,
+    MarketActor,
+    MarketSide,
+    Order,
+    OrderDetail,
+    OrderExecutionOption,
+    OrderState,
+    OrderType,
+    PaginationParams,
+    Price,
+    PublicTrade,
+    PublicTradeFilter,
+    StateDetail,
+    StateReason,
+    Trade,
+    TradeState,
+    UpdateOrder,
+)
+from frequenz.client.electricity_trading._types import _LazyPbSequence
+from google.protobuf import json_format, struct_pb2
+
+_NOW = datetime(2024, 1, 1, 12, 0)
+_AREA = DeliveryArea(code="10YDE-EON------1", code_type=EnergyMarketCodeType.EUROPE_EIC)
+_PERIOD = DeliveryPeriod(start=_NOW, duration=timedelta(minutes=15))
+_PRICE = Price(amount=Decimal("12.5"), currency=Currency.EUR)
+_QUANTITY = Energy(mwh=Decimal("1.5"))
+_ORDER = Order(
+    delivery_area=_AREA,
+    delivery_period=_PERIOD,
+    type=OrderType.LIMIT,
+    side=MarketSide.BUY,
+    price=_PRICE,
+    quantity=_QUANTITY,
+)
+
+
+def test_pagination_params_to_pb_returns_new_message() -> None:
+    """Test that modifying a converted message doesn't affect later conversions."""
+    message = PaginationParams().to_pb()
+    message.page_size = 5
+
+    assert not PaginationParams().to_pb().HasField("page_size")
+
+
+def test_filters_snapshot_list_fields() -> None:
+    """Test that changing the caller's lists doesn't affect existing filters."""
+    order_states = [OrderState.ACTIVE]
+    trade_ids = [1]
+    trade_states = [TradeState.ACTIVE]
+    order_filter = GridpoolOrderFilter(order_states=order_states)
+    trade_filter = GridpoolTradeFilter(trade_id_lists=trade_ids)
+    public_filter = PublicTradeFilter(states=trade_states)
+    keys = {order_filter: "orders", trade_filter: "trades", public_filter: "public"}
+
+    order_states.append(OrderState.CANCELED)
+    trade_ids.append(2)
+    trade_states.append(TradeState.CANCELED)
+
+    assert keys[order_filter] == "orders"
+    assert keys[trade_filter] == "trades"
+    assert keys[public_filter] == "public"
+    assert keys[GridpoolOrderFilter(order_states=[OrderState.ACTIVE])] == "orders"
+    assert order_filter.order_states == (OrderState.ACTIVE,)
+    assert list(order_filter.to_pb().states) == [OrderState.ACTIVE.to_pb()]
+    assert list(trade_filter.to_pb().trade_id_lists) == [1]
+    assert list(public_filter.to_pb().states) == [TradeState.ACTIVE.to_pb()]
+    assert order_filter.to_pb() is not order_filter.to_pb()
+    assert [f.name for f in dataclasses.fields(order_filter)] == [
+        "order_states",
+        "side",
+        "delivery_period",
+        "delivery_area",
+        "tag",
+    ]
+
+
+def test_price_and_energy_to_pb_return_new_messages() -> None:
+    """Test that Price and Energy don't share or expose converted messages."""
+    price = Price(amount=Decimal("10.5"), currency=Currency.EUR)
+    energy = Energy(mwh=Decimal("1.5"))
+
+    price.to_pb().amount.value = "0"
+    energy.to_pb().mwh.value = "0"
+
+    assert price.to_pb().amount.value == "10.5"
+    assert energy.to_pb().mwh.value == "1.5"
+    assert dataclasses.asdict(price) == {
+        "amount": Decimal("10.5"),
+        "currency": Currency.EUR,
+    }
+    assert dataclasses.asdict(energy) == {"mwh": Decimal("1.5")}
+
+
+def test_shared_delivery_period_to_pb_returns_new_message() -> None:
+    """Test that periods shared between messages don't share converted messages."""
+    message = DeliveryPeriod(
+        start=datetime(2024, 1, 1, 12, 0), duration=timedelta(minutes=15)
+    ).to_pb()
+    period = DeliveryPeriod.from_pb(message)
+
+    period.to_pb().duration = DeliveryDuration.MINUTES_30.to_pb()
+
+    assert DeliveryPeriod.from_pb(message) is period
+    assert DeliveryPeriod.from_pb(message).to_pb().duration == message.duration
+    assert period.duration is DeliveryDuration.MINUTES_15
+
+
+def test_delivery_period_replace() -> None:
+    """Test that DeliveryPeriod works with `dataclasses.replace()`."""
+    period = DeliveryPeriod(
+        start=datetime(2024, 1, 1, 12, 0), duration=timedelta(minutes=15)
+    )
+
+    replaced = dataclasses.replace(period, start=datetime(2024, 1, 1, 13, 0))
+
+    assert replaced.start == datetime(2024, 1, 1, 13, 0)
+    assert replaced.duration is DeliveryDuration.MINUTES_15
+    assert replaced == DeliveryPeriod(
+        start=datetime(2024, 1, 1, 13, 0), duration=DeliveryDuration.MINUTES_15
+    )
+    with pytest.raises(ValueError):
+        DeliveryPeriod(
+            start=datetime(2024, 1, 1, 13, 0), duration=DeliveryDuration.UNSPECIFIED
+        )
+
+
+def test_lazy_sequence_compares_like_a_list() -> None:
+    """Test that the sequences returned by list calls compare by their items."""
+    messages = [Energy(mwh=Decimal(1)).to_pb(), Energy(mwh=Decimal(2)).to_pb()]
+    items = _LazyPbSequence(messages, Energy.from_pb)
+
+    assert items == [Energy(mwh=Decimal(1)), Energy(mwh=Decimal(2))]
+    assert items == list(items)
+    assert items == _LazyPbSequence(messages, Energy.from_pb)
+    assert items != [Energy(mwh=Decimal(1))]
+    assert items != "not a sequence of energies"
+    empty: list[Energy] = []
+    assert _LazyPbSequence([], Energy.from_pb) == empty
+
+
+def test_to_pb_sets_timestamps() -> None:
+    """Test that the timestamps of trades and order details are converted."""
+    trade = Trade(
+        id=1,
+        order_id=2,
+        side=MarketSide.SELL,
+        delivery_area=_AREA,
+        delivery_period=_PERIOD,
+        execution_time=_NOW,
+        price=_PRICE,
+        quantity=_QUANTITY,
+        state=TradeState.ACTIVE,
+    )
+    order_detail = OrderDetail(
+        order_id=3,
+        order=_ORDER,
+        state_detail=StateDetail(
+            state=OrderState.ACTIVE,
+            state_reason=StateReason.ADD,
+            market_actor=MarketActor.USER,
+        ),
+        open_quantity=_QUANTITY,
+        filled_quantity=_QUANTITY,
+        create_time=_NOW,
+        modification_time=_NOW + timedelta(minutes=1),
+    )
+    public_trade = PublicTrade(
+        public_trade_id=4,
+        buy_delivery_area=_AREA,
+        sell_delivery_area=_AREA,
+        delivery_period=_PERIOD,
+        modification_time=_NOW,
+        price=_PRICE,
+        quantity=_QUANTITY,
+        state=TradeState.ACTIVE,
+    )
+
+    assert trade.to_pb().execution_time.ToDatetime() == _NOW
+    assert order_detail.to_pb().create_time.ToDatetime() == _NOW
+    assert order_detail.to_pb().modification_time.ToDatetime() == _NOW + timedelta(
+        minutes=1
+    )
+    assert public_trade.to_pb().modification_time.ToDatetime() == _NOW
+    assert Trade.from_pb(trade.to_pb()) == trade
+    assert OrderDetail.from_pb(order_detail.to_pb()) == order_detail
+    assert PublicTrade.from_pb(public_trade.to_pb()) == public_trade
+
+
+def test_filters_with_lists_are_hashable() -> None:
+    """Test that filters with list fields can be used as dictionary keys."""
+    streams = {
+        GridpoolOrderFilter(order_states=[OrderState.ACTIVE]): "orders",
+        GridpoolTradeFilter(
+            trade_states=[TradeState.ACTIVE], trade_id_lists=[1, 2]
+        ): "trades",
+        PublicTradeFilter(states=[TradeState.ACTIVE]): "public trades",
+    }
+
+    assert streams[GridpoolOrderFilter(order_states=[OrderState.ACTIVE])] == "orders"
+    assert (
+        streams[
+            GridpoolTradeFilter(trade_states=[TradeState.ACTIVE], trade_id_lists=[1, 2])
+        ]
+        == "trades"
+    )
+    assert streams[PublicTradeFilter(states=[TradeState.ACTIVE])] == "public trades"
+
+
+def test_filter_from_pb_keeps_unset_fields_as_none() -> None:
+    """Test converting filters whose optional fields are not set."""
+    assert (
+        GridpoolOrderFilter.from_pb(electricity_trading_pb2.GridpoolOrderFilter())
+        == GridpoolOrderFilter()
+    )
+    assert (
+        GridpoolTradeFilter.from_pb(electricity_trading_pb2.GridpoolTradeFilter())
+        == GridpoolTradeFilter()
+    )
+    assert (
+        PublicTradeFilter.from_pb(electricity_trading_pb2.PublicTradeFilter())
+        == PublicTradeFilter()
+    )
+
+    order_filter = GridpoolOrderFilter(
+        order_states=[OrderState.ACTIVE],
+        side=MarketSide.BUY,
+        delivery_period=_PERIOD,
+        delivery_area=_AREA,
+        tag="tag",
+    )
+    trade_filter = GridpoolTradeFilter(
+        trade_states=[TradeState.ACTIVE], trade_id_lists=[1, 2], side=MarketSide.SELL
+    )
+    public_filter = PublicTradeFilter(delivery_period=_PERIOD, buy_delivery_area=_AREA)
+    assert GridpoolOrderFilter.from_pb(order_filter.to_pb()) == order_filter
+    assert GridpoolTradeFilter.from_pb(trade_filter.to_pb()) == trade_filter
+    assert PublicTradeFilter.from_pb(public_filter.to_pb()) == public_filter
+
+
+def test_order_from_pb_valid_until() -> None:
+    """Test that an unset valid_until is converted to None, and a set one kept."""
+    assert Order.from_pb(_ORDER.to_pb()).valid_until is None
+
+    order = dataclasses.replace(_ORDER, valid_until=_NOW)
+    assert Order.from_pb(order.to_pb()).valid_until == _NOW
+
+
+def test_update_order_round_trip() -> None:
+    """Test converting an UpdateOrder with and without an execution option."""
+    update_order = UpdateOrder(
+        price=_PRICE,
+        execution_option=OrderExecutionOption.AON,
+        valid_until=_NOW,
+        payload={"key": "value"},
+        tag="tag",
+    )
+
+    assert UpdateOrder.from_pb(update_order.to_pb()) == update_order
+    assert UpdateOrder.from_pb(UpdateOrder(price=_PRICE).to_pb()) == UpdateOrder(
+        price=_PRICE
+    )
+
+
+_PAYLOAD = {
+    "string": "value",
+    "number": 1.5,
+    "integer": 3,
+    "true": True,
+    "false": False,
+    "null": None,
+    "list": [1, "two", None, False, {"nested": [3]}],
+    "struct": {"inner": {"deeper": "value", "empty": {}}, "empty_list": []},
+}
+
+
+def test_payload_round_trip() -> None:
+    """Test that JSON-like payloads survive a round trip through protobuf."""
+    order = dataclasses.replace(_ORDER, payload=_PAYLOAD)
+    update_order = UpdateOrder(payload=_PAYLOAD)
+
+    order_pb = order.to_pb()
+
+    assert Order.from_pb(order_pb).payload == _PAYLOAD
+    assert UpdateOrder.from_pb(update_order.to_pb()).payload == _PAYLOAD
+    assert Order.from_pb(order_pb).payload == json_format.MessageToDict(
+        order_pb.payload
+    )
+    # Numbers are sent as doubles, as in JSON
+    assert isinstance(order_pb.payload["integer"], float)
+
+
+def test_payload_rejects_protobuf_values() -> None:
+    """Test that protobuf `Value`s are no longer accepted in payloads."""
+    order = dataclasses.replace(
+        _ORDER, payload={"key": struct_pb2.Value(string_value="value")}
+    )
+
+    with pytest.raises(ValueError):
+        order.to_pb()